@@ -1,142 +1,170 @@
-from flask import Flask, jsonify, send_file, render_template_string, abort
+from flask import Flask, Response, request, send_file, abort
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup, escape
 import os
-import json
+import threading
+import functools
+import orjson
+import ijson
 from datetime import datetime
 
 app = Flask(__name__)
 
-# HTML template for the index page
-INDEX_TEMPLATE = """
-<!DOCTYPE html>
-<html>
-<head>
-    <title>TN PDS Crawler</title>
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            line-height: 1.6;
-            margin: 0;
-            padding: 20px;
-            color: #333;
-            max-width: 1200px;
-            margin: 0 auto;
-        }
-        h1 {
-            color: #2c3e50;
-            border-bottom: 1px solid #eee;
-            padding-bottom: 10px;
-        }
-        .card {
-            background: #f9f9f9;
-            border-radius: 5px;
-            padding: 20px;
-            margin-bottom: 20px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        .status-online {
-            color: green;
-            font-weight: bold;
-        }
-        .status-offline {
-            color: #e74c3c;
-            font-weight: bold;
-        }
-        .links {
-            margin-top: 30px;
-        }
-        .links a {
-            display: inline-block;
-            margin-right: 15px;
-            text-decoration: none;
-            color: #3498db;
-            padding: 8px 15px;
-            border: 1px solid #3498db;
-            border-radius: 4px;
-        }
-        .links a:hover {
-            background: #3498db;
-            color: white;
-        }
-        .timestamp {
-            color: #7f8c8d;
-            font-size: 0.9em;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }
-        th, td {
-            padding: 12px 15px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }
-        th {
-            background-color: #f2f2f2;
-        }
-        tr:hover {
-            background-color: #f5f5f5;
-        }
-    </style>
-</head>
-<body>
-    <h1>Tamil Nadu PDS Crawler</h1>
-    
-    <div class="card">
-        <h2>Crawler Status</h2>
-        <p><strong>Status:</strong> {{ status }}</p>
-        <p><strong>Last Run:</strong> <span class="timestamp">{{ last_run }}</span></p>
-        <p><strong>Shops Checked:</strong> {{ shops_checked }}</p>
-        <p><strong>Shops Found:</strong> {{ shops_found }}</p>
-        <p><strong>Online Shops:</strong> <span class="status-online">{{ online_shops }}</span></p>
-        <p><strong>Offline Shops:</strong> <span class="status-offline">{{ offline_shops }}</span></p>
-    </div>
-
-    {% if shops_data %}
-    <div class="card">
-        <h2>Shop Results</h2>
-        <table>
-            <thead>
-                <tr>
-                    <th>Shop ID</th>
-                    <th>Name</th>
-                    <th>District</th>
-                    <th>Taluk</th>
-                    <th>Status</th>
-                    <th>Last Transaction</th>
-                </tr>
-            </thead>
-            <tbody>
-                {% for shop_id, shop in shops_data.items() %}
-                <tr>
-                    <td>{{ shop_id }}</td>
-                    <td>{{ shop.name }}</td>
-                    <td>{{ shop.district }}</td>
-                    <td>{{ shop.taluk }}</td>
-                    <td class="status-{% if shop.status == 'Online' %}online{% else %}offline{% endif %}">{{ shop.status }}</td>
-                    <td>{{ shop.last_transaction.date_time if shop.last_transaction else 'N/A' }}</td>
-                </tr>
-                {% endfor %}
-            </tbody>
-        </table>
-    </div>
-    {% endif %}
-
-    <div class="links">
-        <a href="/">Home</a>
-        <a href="/status">Status API</a>
-        <a href="/results">Raw JSON</a>
-        <a href="/health">Health Check</a>
-    </div>
-</body>
-</html>
-"""
+# Production Jinja settings: no stat()-per-render auto-reload checks, and a
+# bytecode cache so compiled templates survive process restarts
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.cache_size = 400
+os.makedirs('/tmp/jinja_cache', exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache('/tmp/jinja_cache')
+
+def _json_response(obj, status=200):
+    """Serialize with orjson (C, ~5x faster than stdlib) instead of jsonify"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+RESULTS_FILE = '/app/data/shop_status_results.json'
+SUMMARY_FILE = '/app/data/shop_status_summary.json'
+
+def _stream_handle(f, chunk=128 * 1024):
+    """Yield an open file in fixed-size chunks instead of materializing it in memory"""
+    with f:
+        while True:
+            b = f.read(chunk)
+            if not b:
+                break
+            yield b
+
+# In-memory cache of the parsed results JSON, keyed by (mtime_ns, size) so we
+# only re-read and re-parse the file when the crawler has rewritten it
+_RESULTS_CACHE = {}
+
+def _load_json_cached(path):
+    """Return the parsed dict for path, re-reading the file only when it changes.
+
+    Raises FileNotFoundError if the crawler has not produced the file yet.
+    """
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    hit = _RESULTS_CACHE.get(path)
+    if hit and hit[0] == key:
+        return hit[1]
+    with open(path, 'rb') as f:
+        data = orjson.loads(f.read())
+    _RESULTS_CACHE[path] = (key, data)
+    return data
+
+def _load_results():
+    return _load_json_cached(RESULTS_FILE)
+
+def _watch_data_dir():
+    """Reload the cached JSON on inotify events instead of stat-per-request.
+
+    With the watcher running, requests almost always hit an already-warm
+    cache entry; the mtime check in _load_json_cached stays as a safety net
+    (and as the only mechanism on platforms without inotify).
+    """
+    try:
+        from inotify_simple import INotify, flags
+    except ImportError:
+        return
+    try:
+        ino = INotify()
+        ino.add_watch(os.path.dirname(RESULTS_FILE), flags.CLOSE_WRITE | flags.MOVED_TO)
+    except OSError:
+        return
+    watched = {os.path.basename(RESULTS_FILE): RESULTS_FILE,
+               os.path.basename(SUMMARY_FILE): SUMMARY_FILE}
+    while True:
+        for ev in ino.read():
+            path = watched.get(ev.name)
+            if path:
+                try:
+                    _load_json_cached(path)
+                except Exception:
+                    _RESULTS_CACHE.pop(path, None)
+
+threading.Thread(target=_watch_data_dir, daemon=True).start()
+
+def _iter_shop_items():
+    """Stream (shop_id, shop) pairs from the results file with ijson.
+
+    Avoids materializing the whole results tree in memory just to walk it
+    once for the table rows — peak memory is one shop record at a time.
+    """
+    with open(RESULTS_FILE, 'rb') as f:
+        for shop_id, shop in ijson.kvitems(f, 'results'):
+            yield shop_id, shop
+
+def _render_shop_rows(shop_items):
+    """Build the shops <tbody> rows with str.join instead of a Jinja {% for %}.
+
+    The row loop is the hottest part of the page when the shop list is long;
+    joining f-strings in Python skips Jinja's per-row frame machinery. All
+    dynamic fields go through markupsafe.escape.
+    """
+    rows = []
+    for shop_id, shop in shop_items:
+        status = shop.get('status', '')
+        last_txn = shop.get('last_transaction') or {}
+        rows.append(
+            f'<tr>'
+            f'<td>{escape(shop_id)}</td>'
+            f'<td>{escape(shop.get("name", ""))}</td>'
+            f'<td>{escape(shop.get("district", ""))}</td>'
+            f'<td>{escape(shop.get("taluk", ""))}</td>'
+            f'<td class="status-{"online" if status == "Online" else "offline"}">{escape(status)}</td>'
+            f'<td>{escape(last_txn.get("date_time") or "N/A")}</td>'
+            f'</tr>'
+        )
+        # f-strings + escape() produce plain safe markup; mark the joined
+        # result as Markup so Jinja doesn't escape it a second time
+    return Markup("".join(rows))
+
+def _load_summary():
+    """Prefer the small counters-only sidecar written by the crawler; fall
+    back to the full results file for runs predating it"""
+    try:
+        return _load_json_cached(SUMMARY_FILE)
+    except FileNotFoundError:
+        return _load_results()
+
+_MISSING = object()
+
+@functools.lru_cache(maxsize=None)
+def _get_template(name):
+    """Memoized compiled-template lookup; skips the Environment's loader
+    round-trip (and any future auto-reload stat) on every render"""
+    return app.jinja_env.get_template(name)
+
+def _get_summary():
+    """Single access path shared by the views: returns the parsed summary
+    dict, _MISSING when the crawler has not run yet, or the exception"""
+    try:
+        return _load_summary()
+    except FileNotFoundError:
+        return _MISSING
+    except Exception as e:
+        return e
+
+# The index page is a pure function of the results file, so cache the final
+# rendered HTML keyed by the file's mtime — repeat visitors between crawler
+# runs skip context building, row rendering and Jinja entirely
+_INDEX_CACHE = {'key': None, 'html': None}
 
 @app.route('/')
 def index():
-    # Check if results file exists
-    results_file = '/app/data/shop_status_results.json'
+    try:
+        key = os.stat(RESULTS_FILE).st_mtime_ns
+    except OSError:
+        key = 0
+    if _INDEX_CACHE['key'] == key:
+        return _INDEX_CACHE['html']
+    html = _render_index()
+    _INDEX_CACHE['key'] = key
+    _INDEX_CACHE['html'] = html
+    return html
+
+def _render_index():
     context = {
         "status": "running",
         "last_run": "Not yet run",
@@ -146,94 +174,120 @@ def index():
         "offline_shops": 0,
         "shops_data": None
     }
-    
-    if os.path.exists(results_file):
+
+    # Counters come from the small summary sidecar; the per-shop rows are
+    # streamed straight out of the big results file without building the
+    # full dict in memory
+    data = _get_summary()
+    if isinstance(data, Exception):
+        context["status"] = escape(f"Error reading results: {str(data)}")
+    elif data is not _MISSING:
+        # The template runs with autoescape off (everything else it prints is
+        # numeric or pre-escaped), so escape the scraped strings here
+        context.update({
+            "status": "success",
+            "last_run": escape(data.get("timestamp", "unknown")),
+            "shops_checked": data.get("total_shops_checked", 0),
+            "shops_found": data.get("shops_found", 0),
+            "online_shops": data.get("online_shops", 0),
+            "offline_shops": data.get("offline_shops", 0)
+        })
         try:
-            with open(results_file, 'r') as f:
-                data = json.load(f)
-            
-            context.update({
-                "status": "success",
-                "last_run": data.get("timestamp", "unknown"),
-                "shops_checked": data.get("total_shops_checked", 0),
-                "shops_found": data.get("shops_found", 0),
-                "online_shops": data.get("online_shops", 0),
-                "offline_shops": data.get("offline_shops", 0),
-                "shops_data": data.get("results", {})
-            })
+            rows = _render_shop_rows(_iter_shop_items())
         except Exception as e:
-            context["status"] = f"Error reading results: {str(e)}"
-    
-    return render_template_string(INDEX_TEMPLATE, **context)
+            # The crawler rewrites the results file in place, so a request
+            # landing mid-write can hit a truncated JSON stream — degrade
+            # to the error page rather than a 500
+            if not isinstance(e, FileNotFoundError):
+                context["status"] = escape(f"Error reading results: {str(e)}")
+            rows = None
+        if rows:
+            context["shops_data"] = True
+            context["shops_rows"] = rows
+
+    app.update_template_context(context)
+    return _get_template('index.html').render(context)
 
 @app.route('/status')
 def status():
-    # Check if results file exists
-    results_file = '/app/data/shop_status_results.json'
-    if os.path.exists(results_file):
-        try:
-            with open(results_file, 'r') as f:
-                data = json.load(f)
-            return jsonify({
-                "status": "success",
-                "last_run": data.get("timestamp", "unknown"),
-                "shops_checked": data.get("total_shops_checked", 0),
-                "shops_found": data.get("shops_found", 0),
-                "online_shops": data.get("online_shops", 0),
-                "offline_shops": data.get("offline_shops", 0)
-            })
-        except Exception as e:
-            return jsonify({
-                "status": "error",
-                "message": f"Error reading results file: {str(e)}"
-            }), 500
-    else:
-        return jsonify({
+    data = _get_summary()
+    if data is _MISSING:
+        return _json_response({
             "status": "pending",
             "message": "No crawler results found yet. The crawler may not have run."
         })
+    if isinstance(data, Exception):
+        return _json_response({
+            "status": "error",
+            "message": f"Error reading results file: {str(data)}"
+        }, 500)
+    return _json_response({
+        "status": "success",
+        "last_run": data.get("timestamp", "unknown"),
+        "shops_checked": data.get("total_shops_checked", 0),
+        "shops_found": data.get("shops_found", 0),
+        "online_shops": data.get("online_shops", 0),
+        "offline_shops": data.get("offline_shops", 0)
+    })
 
 @app.route('/results')
 def results():
-    # Serve the raw JSON file
-    results_file = '/app/data/shop_status_results.json'
-    if os.path.exists(results_file):
-        try:
-            return send_file(results_file, mimetype='application/json')
-        except Exception as e:
-            return jsonify({
-                "status": "error",
-                "message": f"Error serving results file: {str(e)}"
-            }), 500
-    else:
-        return jsonify({
+    # Serve the raw JSON file with conditional GET so polling dashboards get
+    # a 304 Not Modified instead of the full payload when nothing changed
+    results_file = RESULTS_FILE
+    try:
+        # Serve the pre-gzipped copy written by the crawler when the client
+        # accepts it — saves both network bytes and disk read bandwidth
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            try:
+                resp = send_file(results_file + '.gz', mimetype='application/json',
+                                 conditional=True, etag=True, max_age=30)
+                resp.headers['Content-Encoding'] = 'gzip'
+                resp.headers['Vary'] = 'Accept-Encoding'
+                return resp
+            except FileNotFoundError:
+                pass
+        return send_file(results_file, mimetype='application/json',
+                         conditional=True, etag=True, max_age=30,
+                         last_modified=os.path.getmtime(results_file))
+    except FileNotFoundError:
+        return _json_response({
             "status": "pending",
             "message": "No crawler results found yet. The crawler may not have run."
-        }), 404
+        }, 404)
+    except Exception as e:
+        return _json_response({
+            "status": "error",
+            "message": f"Error serving results file: {str(e)}"
+        }, 500)
+
+# Liveness probes hit /health constantly; precompute the body once so the
+# probe path does no per-request allocation or JSON encoding
+_HEALTH_BODY = b'{"status":"healthy"}'
 
 @app.route('/health')
 def health():
-    return jsonify({"status": "healthy"})
+    return Response(_HEALTH_BODY, mimetype='application/json')
 
 @app.route('/logs')
 def logs():
     # Serve the crawler logs if they exist
     log_file = '/app/data/crawler.log'
-    if os.path.exists(log_file):
-        try:
-            with open(log_file, 'r') as f:
-                log_content = f.read()
-            return log_content, 200, {'Content-Type': 'text/plain'}
-        except Exception as e:
-            return jsonify({
-                "status": "error",
-                "message": f"Error reading log file: {str(e)}"
-            }), 500
-    else:
-        return jsonify({
+    try:
+        # 128 KiB buffer instead of the 8 KiB default — ~16x fewer read()
+        # syscalls on multi-megabyte logs
+        f = open(log_file, 'rb', buffering=1 << 17)
+    except FileNotFoundError:
+        return _json_response({
             "status": "pending",
             "message": "No crawler logs found yet."
-        }), 404
+        }, 404)
+    except Exception as e:
+        return _json_response({
+            "status": "error",
+            "message": f"Error reading log file: {str(e)}"
+        }, 500)
+    return Response(_stream_handle(f), mimetype='text/plain; charset=utf-8')
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=8080)
@@ -3,46 +3,391 @@ Script to navigate the Tamil Nadu PDS website using Selenium
 since it's a complex Ajax-based JSF website that requires proper session handling
 """
 import json
+import logging
+import logging.handlers
 import os
+import queue
+import re
 import sys
 import time
 import uuid
 import shutil
 import tempfile
 import argparse
+import threading
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.support.ui import Select
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+
+# Selenium and webdriver-manager cost ~300-600 ms to import, which
+# dominates --help and bad-input exits. load_selenium() pulls them in on
+# first real use and publishes the names as module globals for the rest
+# of the code.
+_SELENIUM_LOADED = False
+
+def load_selenium():
+    """Import Selenium and webdriver-manager on first use"""
+    global _SELENIUM_LOADED
+    global webdriver, Options, Service, By, Keys, WebDriverWait, Select, EC
+    global ChromeDriverManager
+    global TimeoutException, NoSuchElementException, StaleElementReferenceException
+    if _SELENIUM_LOADED:
+        return
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.common.keys import Keys
+    from selenium.webdriver.support.ui import WebDriverWait, Select
+    from selenium.webdriver.support import expected_conditions as EC
+    from webdriver_manager.chrome import ChromeDriverManager
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
+    _SELENIUM_LOADED = True
+
+# Screenshots and page-source dumps are debugging aids; each one costs a
+# full-page PNG encode or HTML serialization plus a disk write, so
+# production runs skip them unless PDS_CRAWL_DEBUG is set
+_DEBUG = bool(os.environ.get("PDS_CRAWL_DEBUG"))
+
+# Progress chatter on the per-shop hot path goes through a queue-backed
+# logger: emit() is just a queue put, one listener thread does the actual
+# stream writes (so parallel workers don't serialize on the stdout lock),
+# and the WARNING default silences it entirely outside debug runs
+log = logging.getLogger("pds")
+if not log.handlers:
+    _log_q = queue.Queue()
+    _log_listener = logging.handlers.QueueListener(
+        _log_q, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    log.addHandler(logging.handlers.QueueHandler(_log_q))
+log.setLevel(logging.INFO if _DEBUG else logging.WARNING)
+
+def debug_screenshot(driver, path):
+    """Save a screenshot, but only when debug mode is on"""
+    if _DEBUG:
+        try:
+            driver.save_screenshot(path)
+            print(f"Screenshot saved as {path}")
+        except Exception as e:
+            print(f"Failed to save screenshot {path}: {str(e)}")
+
+def debug_dump(path, text):
+    """Write a debug artifact (page source etc.), but only when debug mode
+    is on; the 1 MiB buffer keeps a multi-hundred-KB HTML dump to a couple
+    of write syscalls instead of an 8 KiB loop"""
+    if not _DEBUG:
+        return
+    try:
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(text)
+        print(f"Debug dump saved as {path}")
+    except Exception as e:
+        print(f"Failed to save debug dump {path}: {str(e)}")
+
+# Transient errors are routine in a long crawl; formatting a full
+# traceback and encoding a screenshot per failure costs hundreds of ms
+# and blocks the worker that hit it. Errors land in a bounded ring
+# buffer instead and are summarized once at exit — tracebacks and
+# screenshots only when debug mode is on.
+ERR_RING = deque(maxlen=50)
+_ERR_RING_FLUSH_REGISTERED = False
+
+def _dump_err_ring():
+    if ERR_RING:
+        print(f"\nLast {len(ERR_RING)} errors:")
+        for ts, fn_name, err in ERR_RING:
+            stamp = datetime.fromtimestamp(ts).strftime('%H:%M:%S')
+            print(f"  {stamp} {fn_name}: {err}")
+
+def record_err(fn_name, e, driver=None):
+    """Log an exception cheaply: one ring-buffer entry now, the summary at
+    exit; the expensive traceback/screenshot work only in debug mode"""
+    global _ERR_RING_FLUSH_REGISTERED
+    if not _ERR_RING_FLUSH_REGISTERED:
+        import atexit
+        atexit.register(_dump_err_ring)
+        _ERR_RING_FLUSH_REGISTERED = True
+    ERR_RING.append((time.time(), fn_name, repr(e)))
+    if _DEBUG:
+        import traceback
+        traceback.print_exc()
+        if driver is not None:
+            debug_screenshot(driver, f"{fn_name}_error.png")
+
+class PageCache:
+    """
+    Memoize driver.page_source for the current navigation.
+
+    Every page_source access serializes the entire DOM over the WebDriver
+    wire — hundreds of KB per shop page — and several consumers (debug
+    dump, lxml parse, content checks) want the same HTML. get() re-fetches
+    only when the URL has changed. JSF postbacks can rewrite the DOM
+    without changing the URL, so callers must invalidate() after any click
+    that triggers a partial update.
+    """
+
+    def __init__(self):
+        self._url = None
+        self._source = None
+
+    def get(self, driver):
+        url = driver.current_url
+        if url != self._url:
+            self._source = driver.page_source
+            self._url = url
+        return self._source
+
+    def invalidate(self):
+        self._url = None
+        self._source = None
 
 def save_data_to_json(data, output_file="pds_data.json"):
     """Save extracted data to a JSON file"""
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+
+    # orjson serializes in C (UTF-8 output, like ensure_ascii=False) and
+    # the 1 MiB buffer coalesces the write into a handful of syscalls
+    import orjson
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     print(f"Data saved to {output_file}")
 
+# Debug JSON snapshots accumulate in memory and are written once at
+# shutdown: each save_data_to_json call re-encoded and rewrote the whole
+# dict, so a helper invoked in a loop spent more time dumping than
+# crawling. The file ends up with the last snapshot, same as the
+# overwrite-per-call behaviour it replaces.
+_DEBUG_JSON_BUFFERS = {}
+_DEBUG_JSON_LOCK = threading.Lock()
+
+def _flush_debug_json():
+    with _DEBUG_JSON_LOCK:
+        for output_file, payload in _DEBUG_JSON_BUFFERS.items():
+            try:
+                with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.write(payload)
+                print(f"Data saved to {output_file}")
+            except Exception as e:
+                print(f"Failed to write {output_file}: {str(e)}")
+        _DEBUG_JSON_BUFFERS.clear()
+
+def buffer_debug_json(output_file, data):
+    """Queue a debug snapshot for output_file, serialized now so later
+    mutations don't leak into it; flushed in one buffered write at exit"""
+    import atexit
+    with _DEBUG_JSON_LOCK:
+        if not _DEBUG_JSON_BUFFERS:
+            atexit.register(_flush_debug_json)
+        _DEBUG_JSON_BUFFERS[output_file] = json.dumps(data, indent=4, ensure_ascii=False)
+
+# Background writer: per-shop JSON writes happen while the scraper thread
+# could already be navigating to the next page, so a single daemon thread
+# drains a queue of pre-serialized (path, bytes) jobs and the disk latency
+# overlaps with the next navigation instead of blocking it.
+_WRITE_Q = None
+_WRITE_Q_LOCK = threading.Lock()
+
+def _writer_loop():
+    while True:
+        path, payload = _WRITE_Q.get()
+        try:
+            with open(path, 'wb') as f:
+                f.write(payload)
+        except Exception as e:
+            print(f"Error writing {path}: {str(e)}")
+        finally:
+            _WRITE_Q.task_done()
+
+def enqueue_write(path, payload):
+    """Hand a pre-serialized file write to the background writer thread.
+
+    Payloads are bytes, serialized on the caller's thread, so later
+    mutation of the source dict can't corrupt the write.
+    """
+    global _WRITE_Q
+    with _WRITE_Q_LOCK:
+        if _WRITE_Q is None:
+            import queue
+            import atexit
+            _WRITE_Q = queue.Queue()
+            threading.Thread(target=_writer_loop, daemon=True).start()
+            # Drain outstanding writes before the interpreter exits
+            atexit.register(_WRITE_Q.join)
+    _WRITE_Q.put((path, payload))
+
+def flush_pending_writes():
+    """Block until the background writer has drained its queue"""
+    if _WRITE_Q is not None:
+        _WRITE_Q.join()
+
+def append_jsonl(path, record):
+    """
+    Append one record to a JSON-Lines file.
+
+    Rewriting an accumulated list file on every navigation is O(N^2)
+    bytes over a long crawl; appending one line per record keeps the
+    total at O(N). orjson serializes in C, several times faster than the
+    stdlib encoder.
+    """
+    import orjson
+    with open(path, 'ab', buffering=1 << 20) as f:
+        f.write(orjson.dumps(record) + b'\n')
+
+STATE_REPORT_URL = "https://www.tnpds.gov.in/pages/reports/pds-report-state.xhtml"
+
+def reset_to_state_level(driver, wait):
+    """Jump straight back to the state-level report page — one direct
+    navigation instead of a chain of breadcrumb postbacks"""
+    try:
+        driver.get(STATE_REPORT_URL)
+        wait.until(EC.presence_of_element_located(
+            (By.ID, 'StateLevelDetailsForm:StateLevelDetailsTable')))
+        return True
+    except Exception as e:
+        print(f"Error resetting to state level: {str(e)}")
+        return False
+
+def fetch_districts_http(driver):
+    """
+    Fetch the state-level district listing over plain HTTP and parse it with
+    lxml — milliseconds versus the Selenium per-row scrape. Reuses the
+    driver's JSF session cookies so the server serves the same view; the
+    stateful district/taluk clicks stay on Selenium because they are JSF
+    postbacks bound to the live ViewState.
+    """
+    import requests
+    from lxml import html as lxml_html
+
+    session = requests.Session()
+    for cookie in driver.get_cookies():
+        session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain'))
+
+    resp = session.get(STATE_REPORT_URL, timeout=30)
+    resp.raise_for_status()
+    tree = lxml_html.fromstring(resp.content)
+
+    rows = tree.xpath("//table[@id='StateLevelDetailsForm:StateLevelDetailsTable']//tbody/tr")
+    if not rows:
+        rows = tree.xpath("//table[contains(@id, 'StateLevelDetailsTable')]//tbody/tr")
+
+    districts = []
+    for row in rows:
+        cells = row.xpath('./td')
+        if cells:
+            district_name = cells[0].text_content().strip()
+            if district_name:
+                districts.append(district_name)
+
+    print(f"Fetched {len(districts)} districts over HTTP")
+    return districts
+
+# The state->districts and district->taluks enumerations are stable for a
+# run, so cache them after the first traversal; later lookups only pay for
+# the navigation clicks, not the table re-scrapes
+_DISTRICT_CACHE = None
+# Structural fingerprint (row count + tbody HTML length) of the state table
+# the cached district list was extracted from; lets the cache detect a
+# changed table and re-scrape instead of serving stale rows
+_DISTRICT_SIG = None
+_TALUK_CACHE = {}
+_LISTING_CACHE_LOCK = threading.Lock()
+
+def get_districts_cached(driver, wait):
+    """Navigate to the state-level page and return the district list,
+    serving the enumeration from the run-level cache when possible"""
+    global _DISTRICT_CACHE
+    with _LISTING_CACHE_LOCK:
+        cached = _DISTRICT_CACHE
+    if cached is not None:
+        # The state page still has to be on screen so the caller can click
+        # into a district, but the table scrape is skipped
+        try:
+            navigate_to_pds_reports(driver, wait)
+            wait.until(EC.presence_of_element_located(
+                (By.ID, 'StateLevelDetailsForm:StateLevelDetailsTable')))
+            return list(cached)
+        except Exception as e:
+            print(f"Cached district navigation failed, re-fetching: {str(e)}")
+            with _LISTING_CACHE_LOCK:
+                _DISTRICT_CACHE = None
+
+    # Fast path: navigate with Selenium (the page has to be on screen for
+    # the follow-up district click) but parse the listing over HTTP + lxml
+    districts = None
+    try:
+        if navigate_to_pds_reports(driver, wait):
+            wait.until(EC.presence_of_element_located(
+                (By.ID, 'StateLevelDetailsForm:StateLevelDetailsTable')))
+            districts = fetch_districts_http(driver)
+    except Exception as e:
+        print(f"HTTP district listing failed, using Selenium scrape: {str(e)}")
+
+    # Fall back to the full Selenium scrape
+    if not districts:
+        districts = navigate_to_pds_reports_and_get_districts(driver, wait)
+
+    if districts:
+        with _LISTING_CACHE_LOCK:
+            _DISTRICT_CACHE = list(districts)
+    return districts
+
+def get_taluks_cached(driver, wait, district_name):
+    """Descend into a district and return its taluk list, serving the
+    enumeration from the run-level cache when possible"""
+    with _LISTING_CACHE_LOCK:
+        cached = _TALUK_CACHE.get(district_name)
+    if cached is not None:
+        # The district link still has to be clicked to descend, but the
+        # taluk table scrape is skipped
+        if click_district_link(driver, wait, district_name):
+            return list(cached)
+        with _LISTING_CACHE_LOCK:
+            _TALUK_CACHE.pop(district_name, None)
+
+    taluks = navigate_to_district_and_get_taluks(driver, wait, district_name)
+    if taluks:
+        with _LISTING_CACHE_LOCK:
+            _TALUK_CACHE[district_name] = list(taluks)
+    return taluks
+
+# Completed lookups keyed by (shop_id, known_district, known_taluk), so a
+# repeat of the same request within a run is a dict hit instead of a crawl
+_SHOP_LOOKUP_CACHE = {}
+_SHOP_LOOKUP_LOCK = threading.Lock()
+
 def find_shop_by_id(driver, wait, shop_id, known_district=None, known_taluk=None):
     """
     Find a shop by its ID by searching through districts and taluks
     If known_district and known_taluk are provided, will search only in that location
     Returns a tuple of (found, district, taluk, shop_details) where found is a boolean
+
+    Successful lookups are memoized for the run, so repeated requests for
+    the same shop cost nothing.
     """
+    key = (shop_id, known_district, known_taluk)
+    with _SHOP_LOOKUP_LOCK:
+        if key in _SHOP_LOOKUP_CACHE:
+            print(f"Reusing completed lookup for shop {shop_id}")
+            return _SHOP_LOOKUP_CACHE[key]
+
+    result = _find_shop_by_id_impl(driver, wait, shop_id, known_district, known_taluk)
+
+    # Only successful lookups are cached — a transient failure should be
+    # retried if the shop comes up again
+    if result[0]:
+        with _SHOP_LOOKUP_LOCK:
+            _SHOP_LOOKUP_CACHE[key] = result
+    return result
+
+def _find_shop_by_id_impl(driver, wait, shop_id, known_district=None, known_taluk=None):
+    """Uncached body of find_shop_by_id"""
     print(f"Searching for shop with ID: {shop_id}")
     
     # Navigate to the main page and get districts
     navigate_to_main_page(driver, wait)
-    districts = navigate_to_pds_reports_and_get_districts(driver, wait)
+    districts = get_districts_cached(driver, wait)
     if not districts:
         print("Failed to get districts list")
         return False, None, None, None
@@ -54,10 +399,10 @@ def find_shop_by_id(driver, wait, shop_id, known_district=None, known_taluk=None
     # Search through each district
     for district in districts:
         print(f"Searching in district: {district}")
-        taluks = navigate_to_district_and_get_taluks(driver, wait, district)
+        taluks = get_taluks_cached(driver, wait, district)
         if not taluks:
             print(f"Failed to get taluks for district {district}, skipping")
-            navigate_back_using_breadcrumbs(driver, wait, 'state')
+            reset_to_state_level(driver, wait)
             continue
             
         # If we know the taluk, only search there
@@ -106,11 +451,10 @@ def find_shop_by_id(driver, wait, shop_id, known_district=None, known_taluk=None
                             "status": "Unknown"
                         }
                     
-                    # Navigate back to state level
-                    navigate_back_using_breadcrumbs(driver, wait, 'taluk')
-                    navigate_back_using_breadcrumbs(driver, wait, 'district')
-                    navigate_back_using_breadcrumbs(driver, wait, 'state')
-                    
+                    # Navigate back to state level — one direct load instead
+                    # of walking three breadcrumb postbacks
+                    reset_to_state_level(driver, wait)
+
                     return True, district, taluk, shop_details
             
             # If shop not found in this taluk, go back to district level
@@ -118,25 +462,437 @@ def find_shop_by_id(driver, wait, shop_id, known_district=None, known_taluk=None
                 navigate_back_using_breadcrumbs(driver, wait, 'district')
         
         # If shop not found in this district, go back to state level
-        navigate_back_using_breadcrumbs(driver, wait, 'state')
+        reset_to_state_level(driver, wait)
     
     print(f"Shop {shop_id} not found in any district/taluk")
     return False, None, None, None
 
+def find_shops_in_taluk(driver, wait, district, taluk, shop_items):
+    """
+    Look up several shops that share one (district, taluk) in a single pass.
+
+    Navigates to the taluk once, matches every requested shop ID against the
+    shop table, and collects details for all matches before leaving, instead
+    of restarting the district walk for each shop.
+    Returns a dict of shop_id -> (found, district, taluk, shop_details),
+    or None if the batch navigation failed and the caller should fall back
+    to per-shop lookups.
+    """
+    shop_ids = {item.get('id') for item in shop_items}
+    print(f"Batch lookup of {len(shop_ids)} shops in district {district}, taluk {taluk}")
+    outcomes = {shop_id: (False, None, None, None) for shop_id in shop_ids}
+
+    # Navigate to the taluk once for the whole batch
+    navigate_to_main_page(driver, wait)
+    districts = get_districts_cached(driver, wait)
+    if not districts or district not in districts:
+        print(f"District {district} not available for batch lookup")
+        return None
+
+    taluks = get_taluks_cached(driver, wait, district)
+    if not taluks or taluk not in taluks:
+        print(f"Taluk {taluk} not available in district {district}")
+        return None
+
+    shops = navigate_to_taluk_and_get_shops(driver, wait, taluk)
+    if not shops:
+        print(f"Failed to get shops for taluk {taluk}")
+        return None
+
+    # Create output directory
+    output_dir = f"pds_data/{district}/{taluk}"
+    os.makedirs(output_dir, exist_ok=True)
+
+    remaining = set(shop_ids)
+    for shop in shops:
+        shop_id = shop.get('SHOP CODE', '')
+        if shop_id not in remaining:
+            continue
+        remaining.discard(shop_id)
+        print(f"Found shop {shop_id} in district {district}, taluk {taluk}")
+
+        # Store shop name from the search results for fallback
+        shop_name = shop.get('SHOP NAME', '')
+
+        # Navigate to the shop details page
+        shop_details = navigate_to_shop_and_get_details(driver, wait, shop_id, district, taluk, output_dir, shop_name)
+
+        # If shop details were found but name is missing, add it from search results
+        if isinstance(shop_details, dict) and not shop_details.get('name') and shop_name:
+            shop_details['name'] = shop_name
+
+        # If shop details weren't found, create a basic record from the shop list
+        if not shop_details:
+            shop_details = {
+                "name": shop.get('SHOP NAME', ''),
+                "incharge": shop.get('SHOP INCHARGE', ''),
+                "cards": shop.get('TOTAL NUMBER OF CARDS', ''),
+                "beneficiaries": shop.get('TOTAL NUMBER OF BENEFICIARIES', ''),
+                "status": "Unknown"
+            }
+
+        outcomes[shop_id] = (True, district, taluk, shop_details)
+
+        if remaining:
+            # Come back to the shop table for the next match in this taluk
+            navigate_back_using_breadcrumbs(driver, wait, 'taluk')
+
+    for shop_id in remaining:
+        print(f"Shop {shop_id} not found in taluk {taluk}")
+
+    return outcomes
+
+# Where the live Chrome session's executor URL and session id are recorded
+# so a restarted run can reattach instead of paying the Chrome boot again
+SESSION_FILE = ".selenium_session.json"
+_SESSION_FILE_LOCK = threading.Lock()
+
+def attach_to_existing_session(executor_url, session_id):
+    """
+    Build a Remote driver bound to an already-running Chrome session.
+
+    webdriver.Remote always starts a new session, so a subclass intercepts
+    its own newSession command. The override is instance-scoped — patching
+    RemoteWebDriver.execute class-wide would hijack any driver another
+    thread is booting at the same time (the pool prewarms in parallel).
+    """
+    load_selenium()
+    from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+    class ReattachingRemote(RemoteWebDriver):
+        def execute(self, driver_command, params=None):
+            if driver_command == 'newSession':
+                # Selenium 4 reads response["value"]["sessionId"] and
+                # response["value"]["capabilities"] in start_session
+                return {'value': {'sessionId': session_id, 'capabilities': {}}}
+            return super().execute(driver_command, params)
+
+        def execute_cdp_cmd(self, cmd, cmd_args):
+            # Remote drivers lack ChromiumDriver's helper; the Chrome
+            # remote connection still exposes the vendor endpoint, and the
+            # post-boot tunings (request blocking, tracker) depend on it
+            return self.execute("executeCdpCommand",
+                                {"cmd": cmd, "params": cmd_args})["value"]
+
+    driver = ReattachingRemote(command_executor=executor_url, options=Options())
+    if driver.session_id != session_id:
+        # The stub didn't take — a real new session was started, which the
+        # caller would otherwise mistake for the reattached one
+        raise RuntimeError(
+            f"Reattach produced session {driver.session_id} instead of {session_id}")
+    return driver
+
+def reattach_chrome_session():
+    """
+    Try to reattach to a Chrome left running by a crashed or interrupted
+    run, saving the ~3-5 s boot. Claims the session file so only one
+    worker reattaches; returns a driver or None.
+    """
+    with _SESSION_FILE_LOCK:
+        if not os.path.exists(SESSION_FILE):
+            return None
+        try:
+            with open(SESSION_FILE) as f:
+                info = json.load(f)
+            os.remove(SESSION_FILE)
+        except Exception as e:
+            print(f"Could not read saved session info: {str(e)}")
+            return None
+
+    try:
+        driver = attach_to_existing_session(info["url"], info["session_id"])
+        # Probe the session; a dead Chrome raises here
+        driver.current_url
+        print(f"Reattached to existing Chrome session {info['session_id']}")
+        return driver
+    except Exception as e:
+        print(f"Could not reattach to saved session: {str(e)}")
+        return None
+
+def save_chrome_session(driver):
+    """Record the driver's executor URL and session id for crash recovery"""
+    with _SESSION_FILE_LOCK:
+        if os.path.exists(SESSION_FILE):
+            return
+        try:
+            with open(SESSION_FILE, 'w') as f:
+                json.dump({"url": driver.command_executor._url,
+                           "session_id": driver.session_id}, f)
+        except Exception as e:
+            print(f"Warning: could not save session info: {str(e)}")
+
+def clear_chrome_session():
+    """Drop the saved session info once its Chrome has been quit"""
+    with _SESSION_FILE_LOCK:
+        try:
+            os.remove(SESSION_FILE)
+        except OSError:
+            pass
+
+def find_shops_by_walk(driver, wait, shop_items):
+    """
+    Resolve shops without a full known location in one shared walk.
+
+    Instead of each unlocated shop restarting the state-wide traversal,
+    every taluk visited is checked against the union of all unresolved
+    shop IDs; shops drop out of the set as they are found and the walk
+    stops early once it is empty. Shops with a known district only have
+    that district's taluks searched on their behalf.
+    Returns a dict of shop_id -> (found, district, taluk, shop_details).
+    """
+    # IDs still waiting for a match, each with its district hint (or None)
+    unresolved = {item.get('id'): (item.get('district') or None) for item in shop_items}
+    outcomes = {shop_id: (False, None, None, None) for shop_id in unresolved}
+    print(f"Shared walk for {len(unresolved)} shops without a full location")
+
+    navigate_to_main_page(driver, wait)
+    districts = get_districts_cached(driver, wait)
+    if not districts:
+        print("Failed to get districts list for shared walk")
+        return outcomes
+
+    def wanted_in(district):
+        return any(d is None or d == district for d in unresolved.values())
+
+    for district in districts:
+        if not unresolved:
+            break  # Everyone resolved — stop walking early
+        if not wanted_in(district):
+            continue
+        print(f"Searching in district: {district}")
+        taluks = get_taluks_cached(driver, wait, district)
+        if not taluks:
+            print(f"Failed to get taluks for district {district}, skipping")
+            reset_to_state_level(driver, wait)
+            continue
+
+        for taluk in taluks:
+            if not wanted_in(district):
+                break
+            print(f"Searching in taluk: {taluk}")
+            shops = navigate_to_taluk_and_get_shops(driver, wait, taluk)
+            if not shops:
+                print(f"Failed to get shops for taluk {taluk}, skipping")
+                navigate_back_using_breadcrumbs(driver, wait, 'district')
+                continue
+
+            for shop in shops:
+                shop_id = shop.get('SHOP CODE', '')
+                if shop_id not in unresolved:
+                    continue
+                wanted_district = unresolved[shop_id]
+                if wanted_district is not None and wanted_district != district:
+                    continue
+                print(f"Found shop {shop_id} in district {district}, taluk {taluk}")
+
+                # Store shop name from the search results for fallback
+                shop_name = shop.get('SHOP NAME', '')
+
+                # Create output directory
+                output_dir = f"pds_data/{district}/{taluk}"
+                os.makedirs(output_dir, exist_ok=True)
+
+                # Navigate to the shop details page
+                shop_details = navigate_to_shop_and_get_details(driver, wait, shop_id, district, taluk, output_dir, shop_name)
+
+                # If shop details were found but name is missing, add it from search results
+                if isinstance(shop_details, dict) and not shop_details.get('name') and shop_name:
+                    shop_details['name'] = shop_name
+
+                # If shop details weren't found, create a basic record from the shop list
+                if not shop_details:
+                    shop_details = {
+                        "name": shop.get('SHOP NAME', ''),
+                        "incharge": shop.get('SHOP INCHARGE', ''),
+                        "cards": shop.get('TOTAL NUMBER OF CARDS', ''),
+                        "beneficiaries": shop.get('TOTAL NUMBER OF BENEFICIARIES', ''),
+                        "status": "Unknown"
+                    }
+
+                outcomes[shop_id] = (True, district, taluk, shop_details)
+                del unresolved[shop_id]
+
+                # Back to the shop table for other matches in this taluk
+                navigate_back_using_breadcrumbs(driver, wait, 'taluk')
+
+            # Back to the district's taluk table for the next taluk
+            navigate_back_using_breadcrumbs(driver, wait, 'district')
+
+        reset_to_state_level(driver, wait)
+
+    for shop_id in unresolved:
+        print(f"Shop {shop_id} not found in any district/taluk")
+
+    return outcomes
+
+_PROFILE_ROOT = os.path.abspath(".chrome_profile")
+_PROFILE_SEQ = 0
+_PROFILE_LOCK = threading.Lock()
+
+# Resolved chromedriver path, shared by every driver in the run so only
+# the first initialization pays the webdriver-manager lookup (and pool
+# workers starting together don't race it)
+_CHROMEDRIVER_PATH = None
+_CHROMEDRIVER_LOCK = threading.Lock()
+
+def resolve_chromedriver():
+    """Return the chromedriver path: CHROMEDRIVER_PATH env var if set,
+    otherwise a webdriver-manager install resolved once per process"""
+    global _CHROMEDRIVER_PATH
+    with _CHROMEDRIVER_LOCK:
+        if _CHROMEDRIVER_PATH is None:
+            _CHROMEDRIVER_PATH = (os.environ.get("CHROMEDRIVER_PATH")
+                                  or ChromeDriverManager().install())
+        return _CHROMEDRIVER_PATH
+
+def create_chrome_driver(headless=True):
+    """Create a Chrome WebDriver, trying multiple initialization methods"""
+    load_selenium()
+    # Reuse a Chrome left over from an interrupted run when possible; it
+    # falls through to the same post-boot tunings as a fresh driver —
+    # request blocking, the wider connection pool and the in-flight
+    # tracker live with the client/session, not the saved Chrome
+    driver = reattach_chrome_session()
+    if driver is None:
+        # Initialize Chrome with headless option if specified
+        chrome_options = Options()
+        if headless:
+            chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--disable-gpu")
+        # Return from driver.get() at DOMContentLoaded instead of waiting for
+        # every subresource; the targeted waits below handle readiness per step
+        chrome_options.page_load_strategy = 'eager'
+        # The crawler only reads tables, so don't render images or show
+        # notification prompts; the blink flag covers renderer paths the
+        # content-settings pref misses
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_argument("--disable-features=Translate,AcceptCHFrame")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+
+        # Persistent profile instead of a throwaway temp dir: PDS assets stay
+        # in Chrome's disk cache across shops and across runs. Concurrent
+        # Chromes can't share a user-data-dir, so each driver gets its own
+        # numbered subdir — worker N picks up worker N's cache on the next run.
+        global _PROFILE_SEQ
+        with _PROFILE_LOCK:
+            profile_dir = os.path.join(_PROFILE_ROOT, f"worker_{_PROFILE_SEQ}")
+            _PROFILE_SEQ += 1
+        os.makedirs(profile_dir, exist_ok=True)
+        chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+        chrome_options.add_argument(f"--disk-cache-dir={os.path.join(profile_dir, 'cache')}")
+        print(f"Initializing Chrome with profile directory: {profile_dir}")
+
+        # Initialize Chrome WebDriver with multiple fallback options
+        driver = None
+
+        # Try different methods to initialize Chrome
+        methods = [
+            # Method 1: Pinned or managed chromedriver, resolved once per
+            # process and reused by every worker
+            lambda: webdriver.Chrome(
+                service=webdriver.chrome.service.Service(
+                    executable_path=resolve_chromedriver()
+                ),
+                options=chrome_options
+            ),
+
+            # Method 2: Direct initialization
+            lambda: webdriver.Chrome(options=chrome_options),
+
+            # Method 3: With service object
+            lambda: webdriver.Chrome(
+                service=webdriver.chrome.service.Service(),
+                options=chrome_options
+            ),
+
+            # Method 4: With explicit chromedriver path for GitHub Actions
+            lambda: webdriver.Chrome(
+                service=webdriver.chrome.service.Service(
+                    executable_path="/usr/local/bin/chromedriver"
+                ),
+                options=chrome_options
+            )
+        ]
+
+        # Try each method until one works
+        last_exception = None
+        for i, method in enumerate(methods):
+            try:
+                print(f"Trying Chrome initialization method {i+1}/{len(methods)}")
+                driver = method()
+                print(f"Chrome initialization method {i+1} succeeded")
+                break
+            except Exception as e:
+                print(f"Chrome initialization method {i+1} failed: {str(e)}")
+                last_exception = e
+                continue
+
+        # If all methods failed, raise the last exception
+        if driver is None:
+            raise Exception(f"All Chrome initialization methods failed. Last error: {str(last_exception)}")
+
+    # Block images, fonts, stylesheets and analytics at the network layer —
+    # pure overhead for a table-scraping workload
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": [
+            "*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.ico",
+            "*.woff*", "*.ttf", "*.css",
+            "*googletagmanager*", "*google-analytics*",
+            "*fonts.googleapis.com*", "*fonts.gstatic.com*"
+        ]})
+    except Exception as e:
+        print(f"Warning: could not set up CDP request blocking: {str(e)}")
+
+    # urllib3's default pool keeps one connection per host, so overlapping
+    # WebDriver commands (waits, screenshots, CDP) queue behind each other;
+    # widen the pool so they can run back to back without reconnecting.
+    # Rebuild with the executor's own timeout/cert settings (mirroring its
+    # _get_connection_manager) so commands still time out on a wedged
+    # chromedriver instead of hanging forever.
+    try:
+        import urllib3
+        executor = driver.command_executor
+        pool_args = {"maxsize": 16, "timeout": executor.get_timeout()}
+        if getattr(executor, "_ca_certs", None):
+            pool_args["cert_reqs"] = "CERT_REQUIRED"
+            pool_args["ca_certs"] = executor._ca_certs
+        executor._conn = urllib3.PoolManager(**pool_args)
+    except Exception as e:
+        print(f"Warning: could not resize WebDriver connection pool: {str(e)}")
+
+    # Let wait_for_ajax watch a single in-flight request counter
+    install_inflight_tracker(driver)
+
+    # Record the session so a restart after a crash can reattach
+    save_chrome_session(driver)
+
+    return driver
+
 def process_shop_list_json(shop_list_file, output_json, headless=True):
     """
-    Process a list of shop IDs from a JSON file and check their status
+    Process a list of shop IDs from a JSON file and check their status.
+
+    Shop lookups are independent, so the list is processed by a pool of
+    worker threads, each with its own Chrome driver. The work is I/O-bound
+    (network + DOM waits), so N workers give close to N x wall-clock speedup.
     """
     print(f"Processing shop list from {shop_list_file}")
     start_time = time.time()
-    
+    load_selenium()
+
     # Read the input JSON file
     try:
         with open(shop_list_file, 'r') as f:
             input_data = json.load(f)
             shop_list = input_data.get('shops', [])
             options = input_data.get('options', {})
-            
+
             # Check if the shop list is in the new format (list of objects) or old format (list of strings)
             if shop_list and isinstance(shop_list[0], dict):
                 print(f"Using new JSON format with district and taluk information")
@@ -147,11 +903,31 @@ def process_shop_list_json(shop_list_file, output_json, headless=True):
     except Exception as e:
         print(f"Error reading input JSON file: {str(e)}")
         return False
-    
+
+    # Drop duplicate entries up front — the same (id, district, taluk)
+    # would trigger a full re-crawl just to overwrite its own result
+    seen = set()
+    deduped = []
+    for shop_item in shop_list:
+        key = (shop_item.get('id'), shop_item.get('district'), shop_item.get('taluk'))
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append(shop_item)
+    if len(deduped) < len(shop_list):
+        print(f"Skipping {len(shop_list) - len(deduped)} duplicate shop entries")
+        shop_list = deduped
+
     # Get options
     include_details = options.get('include_details', True)
     headless = options.get('headless', headless)
-    
+
+    # Worker count from the input file, capped to avoid Chrome OOM
+    # (each worker is a full Chrome process on --disable-dev-shm-usage)
+    workers = int(options.get('parallel_workers', 1) or 1)
+    workers = max(1, min(workers, os.cpu_count() or 1, 8))
+    print(f"Using {workers} parallel worker(s)")
+
     # Initialize results
     results = {
         "timestamp": datetime.now().strftime("%Y-%m-%dT%H:%M:%S%z"),
@@ -162,81 +938,68 @@ def process_shop_list_json(shop_list_file, output_json, headless=True):
         "offline_shops": 0,
         "results": {}
     }
-    
-    # Initialize Chrome with headless option if specified
-    chrome_options = Options()
-    if headless:
-        chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--window-size=1920,1080")
-    
-    # Create a unique temporary directory for Chrome data
-    temp_dir = tempfile.mkdtemp(prefix="chrome_temp_")
-    print(f"Initializing Chrome with temp directory: {temp_dir}")
-    
-    # Initialize Chrome WebDriver with multiple fallback options
-    driver = None
-    
-    # Try different methods to initialize Chrome
-    methods = [
-        # Method 1: Direct initialization
-        lambda: webdriver.Chrome(options=chrome_options),
-        
-        # Method 2: With service object
-        lambda: webdriver.Chrome(
-            service=webdriver.chrome.service.Service(),
-            options=chrome_options
-        ),
-        
-        # Method 3: With explicit chromedriver path for GitHub Actions
-        lambda: webdriver.Chrome(
-            service=webdriver.chrome.service.Service(
-                executable_path="/usr/local/bin/chromedriver"
-            ),
-            options=chrome_options
-        )
-    ]
-    
-    # Try each method until one works
-    last_exception = None
-    for i, method in enumerate(methods):
+
+    # Incremental JSON-Lines log: every finished shop is appended and
+    # flushed immediately, so a hard crash loses nothing and a restart
+    # skips the shops already resolved
+    import orjson
+    jsonl_path = output_json + '.jsonl'
+    recovered = {}
+    if os.path.exists(jsonl_path):
         try:
-            print(f"Trying Chrome initialization method {i+1}/{len(methods)}")
-            driver = method()
-            print(f"Chrome initialization method {i+1} succeeded")
-            break
+            with open(jsonl_path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        recovered.update(orjson.loads(line))
+            print(f"Recovered {len(recovered)} shop results from {jsonl_path}")
         except Exception as e:
-            print(f"Chrome initialization method {i+1} failed: {str(e)}")
-            last_exception = e
-            continue
-    
-    # If all methods failed, raise the last exception
-    if driver is None:
-        raise Exception(f"All Chrome initialization methods failed. Last error: {str(last_exception)}")
-    
-    wait = WebDriverWait(driver, 20)
-    
+            print(f"Warning: could not read incremental results: {str(e)}")
+            recovered = {}
+    if recovered:
+        # Fold the recovered results in and only crawl what's left
+        for shop_id, entry in recovered.items():
+            results["results"][shop_id] = entry
+            if entry.get("found"):
+                results["shops_found"] += 1
+                status = str(entry.get("status", "")).lower()
+                if status == 'online':
+                    results["online_shops"] += 1
+                elif status == 'offline':
+                    results["offline_shops"] += 1
+            else:
+                results["shops_not_found"] += 1
+        shop_list = [s for s in shop_list if s.get('id') not in recovered]
+        print(f"{len(shop_list)} shops left to crawl after recovery")
+
     try:
-        # Navigate to the main page
-        navigate_to_main_page(driver, wait)
-        
-        # Process each shop in the list
-        for shop_item in shop_list:
-            # Extract shop information
-            shop_id = shop_item.get('id')
-            known_district = shop_item.get('district')
-            known_taluk = shop_item.get('taluk')
-            
-            if known_district and known_taluk:
-                print(f"Using provided district '{known_district}' and taluk '{known_taluk}' for shop {shop_id}")
-            elif known_district:
-                print(f"Using provided district '{known_district}' for shop {shop_id}")
-            
-            # Find the shop using available information
-            found, district, taluk, shop_details = find_shop_by_id(driver, wait, shop_id, known_district, known_taluk)
-            
+        jsonl_f = open(jsonl_path, 'ab')
+    except Exception as e:
+        print(f"Warning: could not open incremental results file: {str(e)}")
+        jsonl_f = None
+
+    # Every driver created by the pool, so the finally block can close them
+    drivers = []
+    drivers_lock = threading.Lock()
+    results_lock = threading.Lock()
+    worker_state = threading.local()
+
+    def get_worker_driver():
+        """Lazily create one driver per worker thread and reuse it"""
+        if getattr(worker_state, 'driver', None) is None:
+            driver = create_chrome_driver(headless)
+            with drivers_lock:
+                drivers.append(driver)
+            wait = WebDriverWait(driver, 20, poll_frequency=0.1)
+            # Land on the main page once per worker to amortize session setup
+            navigate_to_main_page(driver, wait)
+            worker_state.driver = driver
+            worker_state.wait = wait
+        return worker_state.driver, worker_state.wait
+
+    def record_result(shop_id, found, district, taluk, shop_details):
+        """Merge one shop's outcome into the shared results dict"""
+        with results_lock:
             if found and shop_details:
                 results["shops_found"] += 1
                 results["results"][shop_id] = {
@@ -244,12 +1007,12 @@ def process_shop_list_json(shop_list_file, output_json, headless=True):
                     "district": district,
                     "taluk": taluk
                 }
-                
+
                 # Add shop details if available
                 if include_details and isinstance(shop_details, dict):
                     for key, value in shop_details.items():
                         results["results"][shop_id][key] = value
-                
+
                 # Update status counts
                 if isinstance(shop_details, dict):
                     status = shop_details.get('status', '').lower()
@@ -263,126 +1026,454 @@ def process_shop_list_json(shop_list_file, output_json, headless=True):
                     "found": False,
                     "error": "Shop ID not found in the system"
                 }
+
+            # Append the finished shop to the JSON-Lines log right away
+            if jsonl_f is not None:
+                try:
+                    jsonl_f.write(orjson.dumps(
+                        {shop_id: results["results"][shop_id]}) + b'\n')
+                    jsonl_f.flush()
+                except Exception as e:
+                    print(f"Warning: could not append incremental result: {str(e)}")
+
+    def process_one_shop(shop_item):
+        """Look up one shop via the full district walk"""
+        shop_id = shop_item.get('id')
+        known_district = shop_item.get('district')
+        known_taluk = shop_item.get('taluk')
+
+        if known_district and known_taluk:
+            print(f"Using provided district '{known_district}' and taluk '{known_taluk}' for shop {shop_id}")
+        elif known_district:
+            print(f"Using provided district '{known_district}' for shop {shop_id}")
+
+        # Find the shop using available information
+        try:
+            driver, wait = get_worker_driver()
+            found, district, taluk, shop_details = find_shop_by_id(driver, wait, shop_id, known_district, known_taluk)
+        except Exception as e:
+            print(f"Error processing shop {shop_id}: {str(e)}")
+            found, district, taluk, shop_details = False, None, None, None
+
+        record_result(shop_id, found, district, taluk, shop_details)
+
+    def process_group(group):
+        """Look up all shops sharing one (district, taluk) in a single pass"""
+        (district, taluk), items = group
+        try:
+            driver, wait = get_worker_driver()
+            outcomes = find_shops_in_taluk(driver, wait, district, taluk, items)
+        except Exception as e:
+            print(f"Error processing batch for {district}/{taluk}: {str(e)}")
+            outcomes = None
+
+        if outcomes is None:
+            # Batch navigation failed; fall back to per-shop lookups
+            for item in items:
+                process_one_shop(item)
+            return
+
+        for item in items:
+            shop_id = item.get('id')
+            found, found_district, found_taluk, shop_details = outcomes.get(
+                shop_id, (False, None, None, None))
+            record_result(shop_id, found, found_district, found_taluk, shop_details)
+
+    def process_walk(items):
+        """Resolve every not-fully-located shop in one shared state walk"""
+        try:
+            driver, wait = get_worker_driver()
+            outcomes = find_shops_by_walk(driver, wait, items)
+        except Exception as e:
+            print(f"Error in shared walk: {str(e)}")
+            outcomes = None
+
+        if outcomes is None:
+            # Shared walk failed outright; fall back to per-shop lookups
+            for item in items:
+                process_one_shop(item)
+            return
+
+        for item in items:
+            shop_id = item.get('id')
+            found, found_district, found_taluk, shop_details = outcomes.get(
+                shop_id, (False, None, None, None))
+            record_result(shop_id, found, found_district, found_taluk, shop_details)
+
+    # Group shops with a full known location by (district, taluk) so each
+    # taluk is navigated once per batch instead of once per shop; shops
+    # without both district and taluk share a single state-wide walk that
+    # checks every visited taluk against all of them at once
+    groups = defaultdict(list)
+    ungrouped = []
+    for shop_item in shop_list:
+        if shop_item.get('district') and shop_item.get('taluk'):
+            groups[(shop_item['district'], shop_item['taluk'])].append(shop_item)
+        else:
+            ungrouped.append(shop_item)
+    print(f"Grouped {len(shop_list) - len(ungrouped)} shops into {len(groups)} "
+          f"(district, taluk) batches; {len(ungrouped)} share the full walk")
+
+    completed = False
+    try:
+        # Process the batches and the shared walk through the pool; each
+        # worker boots its own Chrome on first use and keeps it for the
+        # rest of the run
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(process_group, group) for group in groups.items()]
+            if ungrouped:
+                futures.append(pool.submit(process_walk, ungrouped))
+            for future in futures:
+                future.result()
+        completed = True
     except Exception as e:
         print(f"Error during crawling: {str(e)}")
     finally:
         # Calculate execution time
         execution_time = time.time() - start_time
         results["execution_time_seconds"] = round(execution_time, 2)
-        
-        # Save results to JSON file
+
+        if jsonl_f is not None:
+            try:
+                jsonl_f.close()
+            except Exception:
+                pass
+
+        # Save results to JSON file (compact — indent would double the
+        # serialization work and file size for no consumer benefit)
         with open(output_json, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-        
+            json.dump(results, f, ensure_ascii=False)
+
+        # Pre-compress the results so the web app can serve gzip without
+        # re-compressing per request
+        try:
+            import gzip
+            with open(output_json, 'rb') as f_in, gzip.open(output_json + '.gz', 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out)
+        except Exception as e:
+            print(f"Warning: failed to write gzipped results: {str(e)}")
+
+        # Also write a tiny summary sidecar (counters only, no per-shop detail)
+        # so status consumers don't have to parse the full results file
+        summary = {k: v for k, v in results.items() if k != "results"}
+        summary_json = os.path.join(os.path.dirname(output_json) or '.', 'shop_status_summary.json')
+        with open(summary_json, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+
+        # Only a clean pass retires the incremental log — after a crash or
+        # interrupt it is exactly what the next run needs to resume from
+        if completed:
+            try:
+                os.remove(jsonl_path)
+            except OSError:
+                pass
+
         print(f"Results saved to {output_json}")
         print(f"Found {results['shops_found']} shops out of {results['total_shops_checked']}")
         print(f"Online shops: {results['online_shops']}, Offline shops: {results['offline_shops']}")
         
-        # Close the browser
-        driver.quit()
+        # Close every browser the pool created; the saved session info only
+        # survives a crash, where these quits never run
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        clear_chrome_session()
     
     return True
 
+def extract_table_cells(driver, table):
+    """
+    Pull a table's full text content in a single execute_script round-trip.
+
+    Returns (header_texts, rows) where rows is a list of per-row lists of
+    cell strings. The per-row find_elements/.text pattern costs one
+    WebDriver round-trip per cell; for a 300-row table this collapses
+    roughly 900 round-trips into one.
+    """
+    headers, rows = driver.execute_script("""
+        const t = arguments[0];
+        const headers = Array.from(t.querySelectorAll('th')).map(h => h.innerText.trim());
+        const rows = Array.from(t.querySelectorAll('tbody tr')).map(
+            r => Array.from(r.querySelectorAll('td')).map(c => c.innerText.trim()));
+        return [headers, rows];
+    """, table)
+    return headers, rows
+
+def dump_select(driver, select):
+    """
+    Return [{"value", "text"}] for every option of a <select> in one
+    execute_script round-trip. Accepts an element id or a live element
+    handle. Iterating Select.options costs two WebDriver commands per
+    option (get_attribute + .text) — hundreds for the district and shop
+    dropdowns; this collapses them to one.
+    """
+    return driver.execute_script("""
+        var s = typeof arguments[0] === 'string'
+            ? document.getElementById(arguments[0]) : arguments[0];
+        if (!s) { return []; }
+        return Array.from(s.options).map(function(o) {
+            return {value: o.value, text: o.text.trim()};
+        });
+    """, select)
+
+def click_row_link_by_text(driver, table, name):
+    """
+    Find the row whose first cell matches `name` and click its link, all
+    inside one execute_script. Accepts a CSS selector or a live table
+    element. The Python search loop paid ~2 WebDriver round-trips per row
+    before it even reached the click; this is one call regardless of
+    table size. Returns True if a matching link was clicked.
+    """
+    return driver.execute_script("""
+        var t = typeof arguments[0] === 'string'
+            ? document.querySelector(arguments[0]) : arguments[0];
+        if (!t) { return false; }
+        var name = arguments[1].trim().toLowerCase();
+        var rows = t.querySelectorAll('tbody tr');
+        for (var i = 0; i < rows.length; i++) {
+            var r = rows[i];
+            if (r.cells[0] && r.cells[0].innerText.trim().toLowerCase() === name) {
+                var a = r.querySelector('a');
+                if (a) { a.click(); return true; }
+            }
+        }
+        return false;
+    """, table, name)
+
+def find_first_matching(driver, selectors):
+    """
+    Try an ordered list of CSS selectors in one script call and return
+    (selector, element) for the first that matches, or None. Probing the
+    candidates with one find_elements each costs a WebDriver round-trip
+    per miss; walking the list in-browser keeps the priority order and
+    pays for a single call. Invalid selectors are skipped like the old
+    per-selector try/except did.
+    """
+    match = driver.execute_script("""
+        var selectors = arguments[0];
+        for (var i = 0; i < selectors.length; i++) {
+            var el = null;
+            try { el = document.querySelector(selectors[i]); } catch (e) { continue; }
+            if (el) { return [selectors[i], el]; }
+        }
+        return null;
+    """, selectors)
+    return match
+
+def pick_data_table(driver, selectors):
+    """
+    Walk an ordered list of table selectors in one script call and return
+    [selector, element] for the first table with more than one body row,
+    or None. The old pattern issued a find_elements per selector and then
+    counted rows from Python — up to five round-trips plus one per
+    candidate table just to skip menus and other small UI tables.
+    """
+    return driver.execute_script("""
+        var selectors = arguments[0];
+        for (var s = 0; s < selectors.length; s++) {
+            var tables;
+            try { tables = document.querySelectorAll(selectors[s]); }
+            catch (e) { continue; }
+            for (var i = 0; i < tables.length; i++) {
+                if (tables[i].querySelectorAll('tbody tr').length > 1) {
+                    return [selectors[s], tables[i]];
+                }
+            }
+        }
+        return null;
+    """, selectors)
+
+# Candidate data-table selectors, most specific first. pick_data_table
+# walks them in priority order inside one script call, so the common case
+# stops at the id-suffix entry; rebuilding these lists inside every
+# navigation call added avoidable per-call work on the hot path.
+TALUK_TABLE_SELECTORS = [
+    '[id$="TalukLevelDetailsTable"]',  # Ends with TalukLevelDetailsTable
+    '[id*="Taluk"][id*="Table"]',      # Contains both 'Taluk' and 'Table'
+    '.ui-datatable',                   # PrimeFaces datatable class
+    'table.dataTable',                 # Common datatable class
+    'table:not(.ui-menu-list)'         # Any table that's not a menu
+]
+SHOP_TABLE_SELECTORS = [
+    '[id$="ShopLevelDetailsTable"]',   # Ends with ShopLevelDetailsTable
+    '[id*="Shop"][id*="Table"]',       # Contains both 'Shop' and 'Table'
+    '.ui-datatable',                   # PrimeFaces datatable class
+    'table.dataTable',                 # Common datatable class
+    'table:not(.ui-menu-list)'         # Any table that's not a menu
+]
+
+# Column order of the bill-details dialog table (from the PrimeFaces markup)
+BILL_ITEM_KEYS = ("sno", "product_name", "quantity", "unit_price", "total", "unit")
+
 def find_element_with_retry(driver, wait, selectors, element_name="element"):
-    """Try multiple selectors to find an element with retry logic"""
-    for selector in selectors:
-        try:
-            element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-            print(f"Found {element_name} with selector: {selector}")
-            return element
-        except:
-            continue
-    return None
+    """
+    Find an element matching any of the candidate selectors.
 
-def wait_for_ajax(driver, wait):
-    """Wait for AJAX calls to complete"""
+    The candidates are joined into one CSS selector list ("a, b, c") so the
+    browser evaluates them all in a single DOM pass and one wait bounds the
+    total time — trying them one by one meant every miss burned the full
+    wait timeout before the next candidate was even attempted.
+    """
+    combined = ", ".join(selectors)
     try:
-        wait.until(lambda d: d.execute_script('return jQuery.active == 0'))
-        time.sleep(1)  # Additional small delay
+        element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, combined)))
+        print(f"Found {element_name} with selector list: {combined}")
+        return element
     except:
-        time.sleep(2)  # Fallback delay if jQuery is not available
+        return None
+
+# Counts every XHR and fetch the page has in flight, so AJAX-completion
+# waits watch one integer instead of poking at jQuery internals. Installed
+# via CDP on every new document, so the counter never misses early requests.
+_INFLIGHT_TRACKER_JS = """
+if (!window.__pdsInflightInstalled) {
+    window.__pdsInflightInstalled = true;
+    window.__pdsInflight = 0;
+    const origSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        window.__pdsInflight++;
+        this.addEventListener('loadend', function() { window.__pdsInflight--; });
+        return origSend.apply(this, arguments);
+    };
+    if (window.fetch) {
+        const origFetch = window.fetch;
+        window.fetch = function() {
+            window.__pdsInflight++;
+            return origFetch.apply(this, arguments).finally(function() { window.__pdsInflight--; });
+        };
+    }
+}
+"""
+
+def install_inflight_tracker(driver):
+    """Instrument XHR/fetch on every new document for wait_for_ajax"""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                               {"source": _INFLIGHT_TRACKER_JS})
+    except Exception as e:
+        print(f"Warning: could not install request tracker: {str(e)}")
+
+# WebDriverWait holds no state between .until() calls, so instances are
+# cached per (session, timeout, poll) instead of being rebuilt on every
+# wait in the per-shop hot loops
+_WAIT_CACHE = {}
+
+def get_wait(driver, timeout, poll_frequency=0.1):
+    """Return a cached WebDriverWait for this driver/timeout combination"""
+    key = (driver.session_id, timeout, poll_frequency)
+    w = _WAIT_CACHE.get(key)
+    if w is None:
+        w = WebDriverWait(driver, timeout, poll_frequency=poll_frequency)
+        _WAIT_CACHE[key] = w
+    return w
+
+def wait_for_ajax(driver, wait, timeout=10):
+    """Wait for in-flight AJAX requests to drain"""
+    try:
+        # 50 ms polls detect completion ~10x sooner than the default 500 ms
+        get_wait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: d.execute_script(
+                "return (window.__pdsInflight || 0) === 0"
+                " && (window.jQuery ? jQuery.active == 0 : true)"
+                " && document.readyState != 'loading'"))
+    except:
+        time.sleep(2)  # Fallback delay if the readiness check fails
+
+def wait_for_page_load(driver, timeout=15):
+    """
+    Wait for the document load event to have fired.
+
+    A warm page answers the very first probe (readyState is already
+    'complete'), so the common case costs a single round-trip; 50 ms
+    polls pick up a real load ~10x sooner than the default 500 ms
+    interval. performance.timing.loadEventEnd catches the edge where a
+    readyState sample lands between documents.
+    """
+    get_wait(driver, timeout, poll_frequency=0.05).until(
+        lambda d: d.execute_script(
+            "return document.readyState === 'complete'"
+            " || (window.performance && performance.timing.loadEventEnd > 0)"))
+
+def preset_english_locale(driver):
+    """
+    Seed the English locale cookie on a driver's first visit so pages come
+    up already in English and switch_to_english reduces to its cheap
+    body-class check instead of driving the radio-button postback
+    (~3-10 s per fresh session — per worker with the pool).
+    """
+    if getattr(driver, '_locale_preset', False):
+        return
+    driver._locale_preset = True
+    try:
+        # Cookies can only be set for the current domain, so this costs
+        # one homepage load per driver lifetime
+        driver.get("https://www.tnpds.gov.in/")
+        driver.add_cookie({'name': 'locale', 'value': 'en', 'domain': 'www.tnpds.gov.in'})
+        print("Preset English locale cookie")
+    except Exception as e:
+        print(f"Warning: could not preset English locale: {str(e)}")
 
 def switch_to_english(driver, wait):
     """Switch the website language to English"""
+    # One reusable fast-polling wait: 0.1 s polls spot the switch ~5x
+    # sooner than WebDriverWait's default 0.5 s
+    fast_wait = WebDriverWait(driver, 10, poll_frequency=0.1)
+
+    def in_english(d):
+        return 'lang-english' in d.find_element(By.TAG_NAME, 'body').get_attribute('class')
+
     max_retries = 3
     for attempt in range(max_retries):
         try:
             print(f"\nAttempt {attempt + 1} to switch language")
-            
+
             # Wait for page to be fully loaded
-            wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-            print("Page loaded")
-            
-            # Check if already in English
-            body_class = driver.find_element(By.TAG_NAME, 'body').get_attribute('class')
-            if 'lang-english' in body_class:
+            wait_for_page_load(driver)
+
+            # Check for English, find the radio and click it in a single
+            # in-page script — one round-trip instead of a find_elements /
+            # is_selected / click sequence with a race between them
+            state = driver.execute_script("""
+                if (document.body.className.indexOf('lang-english') !== -1) {
+                    return 'english';
+                }
+                var radio = document.querySelector(
+                    '#masterForm\\\\:languageSelectMenu input[type="radio"][value="en"]');
+                if (!radio) {
+                    return 'no-radio';
+                }
+                if (!radio.checked) {
+                    radio.click();
+                    if (radio.form) { radio.form.submit(); }
+                }
+                return 'clicked';
+            """)
+            if state == 'english':
                 print("Already in English mode")
                 return True
-                
-            # Wait for the masterForm to be present
-            try:
-                master_form = wait.until(EC.presence_of_element_located((By.ID, 'masterForm')))
-                print("Found masterForm")
-                
-                # Find the language menu table
-                lang_table = wait.until(EC.presence_of_element_located(
-                    (By.ID, 'masterForm:languageSelectMenu')
-                ))
-                print("Found language menu")
-                
-                # Find all radio buttons in the language menu
-                radio_buttons = lang_table.find_elements(By.CSS_SELECTOR, 'input[type="radio"]')
-                print(f"Found {len(radio_buttons)} language options")
-                
-                # Find and click the English radio button
-                for radio in radio_buttons:
-                    if radio.get_attribute('value') == 'en':
-                        print("Found English radio button")
-                        if not radio.is_selected():
-                            print("Clicking English option...")
-                            try:
-                                radio.click()
-                            except:
-                                print("Direct click failed, trying JavaScript")
-                                driver.execute_script("""
-                                    var radio = arguments[0];
-                                    radio.click();
-                                    radio.form.submit();
-                                """, radio)
-                            
-                            # Wait for page reload
-                            time.sleep(3)
-                            wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-                            print("Page reloaded")
-                            
-                            # Verify language switch
-                            body_class = driver.find_element(By.TAG_NAME, 'body').get_attribute('class')
-                            if 'lang-english' in body_class:
-                                print("Successfully switched to English")
-                                return True
-                        else:
-                            print("English already selected")
-                            return True
-                
-                print("Could not find English radio button")
-            except:
-                # Alternative approach - look for language links
-                print("Could not find masterForm, trying alternative approach")
-                
-                # Try finding all links and look for one that might be a language switcher
-                all_links = driver.find_elements(By.TAG_NAME, "a")
-                for link in all_links:
-                    try:
-                        href = link.get_attribute("href")
-                        text = link.text.strip()
-                        if (href and "locale=en" in href) or (text and "English" in text):
-                            driver.execute_script("arguments[0].click();", link)
-                            print(f"Clicked language switcher: {text} with href: {href}")
-                            time.sleep(2)  # Wait for language change
-                            return True
-                    except:
-                        continue
-            
+            if state == 'clicked':
+                print("Clicked English radio button")
+            else:
+                # Alternative approach - look for a language switcher link
+                print("Could not find language radio, trying switcher links")
+                links = driver.find_elements(By.CSS_SELECTOR, 'a[href*="locale=en"]')
+                if not links:
+                    print("Could not find a language switcher")
+                    continue
+                driver.execute_script("arguments[0].click();", links[0])
+
+            # One fast-polling wait covers the reload and the verification;
+            # no fixed sleeps between retries — each attempt is bounded by
+            # its waits
+            fast_wait.until(in_english)
+            print("Successfully switched to English")
+            return True
+
+        except TimeoutException:
+            print(f"Language switch not confirmed on attempt {attempt + 1}, retrying...")
+            continue
         except Exception as e:
             print(f"Error on attempt {attempt + 1}: {str(e)}")
             if attempt == max_retries - 1:
@@ -398,18 +1489,29 @@ def switch_to_english(driver, wait):
                     print(f"Error getting debug info: {str(debug_e)}")
             else:
                 print("Retrying...")
-                time.sleep(2)
                 continue
-                
+
     return False
 
+# Menu selectors for navigate_to_district_table, precomputed once instead
+# of rebuilding the candidate lists and doing :contains -> XPath string
+# surgery on every call
+_REPORTS_MENU_CSS = 'a[onclick*="masterForm:j_idt82"]'
+_REPORTS_MENU_XPATH = ("//a[contains(text(),'Reports')]"
+                       " | //a[contains(@class,'ui-menuitem-link') and contains(text(),'Reports')]"
+                       " | //li[contains(@class,'ui-menuitem') and contains(.,'Reports')]/a")
+_FPS_REPORTS_XPATH = ("//a[contains(text(),'FPS Reports')]"
+                      " | //li[contains(@class,'ui-menuitem') and contains(.,'FPS Reports')]/a"
+                      " | //a[contains(@class,'ui-menuitem-link') and contains(text(),'FPS')]")
+
 def navigate_to_district_table(driver, wait):
     """Navigate to the district table on the PDS website"""
     try:
-        # Go to homepage
+        # Go to homepage (with the English locale cookie already seeded)
         print("Loading main page...")
+        preset_english_locale(driver)
         driver.get("https://www.tnpds.gov.in/")
-        
+
         # Wait for page to load
         wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
         print("Main page loaded")
@@ -419,27 +1521,29 @@ def navigate_to_district_table(driver, wait):
             print("Warning: Failed to switch to English, continuing anyway")
         
         # Take screenshot for debugging
-        driver.save_screenshot("main_page.png")
-        print("Screenshot saved as main_page.png")
-        
-        # Find and click PDS Reports link directly
+        debug_screenshot(driver, "main_page.png")
+
+        # Find and click PDS Reports link directly — one targeted XPath
+        # instead of serializing every <a> on the page over the wire
         print("Looking for PDS Reports link...")
-        links = driver.find_elements(By.TAG_NAME, 'a')
         pds_reports_link = None
-        for link in links:
-            if link.text == 'PDS Reports':
-                pds_reports_link = link
-                print("Found PDS Reports link")
-                break
-                
+        matches = driver.find_elements(By.XPATH, "//a[normalize-space(text())='PDS Reports']")
+        if matches:
+            pds_reports_link = matches[0]
+            print("Found PDS Reports link")
+
+
         if pds_reports_link:
             try:
                 pds_reports_link.click()
                 print("Clicked PDS Reports link")
-                
-                # Wait for page to load
-                time.sleep(2)
-                wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+
+                # Wait for the navigation to replace the page
+                try:
+                    wait.until(EC.staleness_of(pds_reports_link))
+                except TimeoutException:
+                    pass
+                wait_for_page_load(driver)
                 print("Successfully loaded PDS Reports page")
                 
                 # Now look for the district table
@@ -450,15 +1554,14 @@ def navigate_to_district_table(driver, wait):
                         (By.ID, 'StateLevelDetailsForm:StateLevelDetailsTable')
                     ))
                     print("Found district table")
-                    
+
                     # Take screenshot of district table
-                    driver.save_screenshot("district_table.png")
-                    print("District table screenshot saved")
-                    
+                    debug_screenshot(driver, "district_table.png")
+
                     return table
                 except Exception as e:
                     print(f"Error finding district table: {str(e)}")
-                    driver.save_screenshot("district_table_error.png")
+                    debug_screenshot(driver, "district_table_error.png")
                     return None
             except Exception as e:
                 print(f"Error clicking PDS Reports link: {str(e)}")
@@ -466,36 +1569,18 @@ def navigate_to_district_table(driver, wait):
         # If direct link not found, try through Reports menu
         print("PDS Reports link not found, trying through Reports menu...")
         
-        # Try multiple approaches to find the Reports menu
-        reports_menu_selectors = [
-            'a[onclick*="masterForm:j_idt82"]',
-            'a:contains("Reports")',
-            'a.ui-menuitem-link:contains("Reports")',
-            'li.ui-menuitem:contains("Reports") > a'
-        ]
-        
+        # Try the onclick CSS selector first, then one unioned XPath that
+        # covers all the text-based candidates in a single DOM query
         reports_menu = None
-        for selector in reports_menu_selectors:
-            try:
-                # Try CSS selector first
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    reports_menu = elements[0]
-                    break
-            except:
-                try:
-                    # Try XPath as fallback
-                    if "contains" in selector:
-                        xpath = selector.replace('a:contains("', '//a[contains(text(),"').replace('")', '")]')
-                        xpath = xpath.replace('a.ui-menuitem-link:contains("', '//a[@class="ui-menuitem-link" and contains(text(),"')
-                        xpath = xpath.replace('li.ui-menuitem:contains("', '//li[contains(@class,"ui-menuitem") and contains(.,"')
-                        elements = driver.find_elements(By.XPATH, xpath)
-                        if elements:
-                            reports_menu = elements[0]
-                            break
-                except:
-                    continue
-        
+        try:
+            elements = driver.find_elements(By.CSS_SELECTOR, _REPORTS_MENU_CSS)
+            if not elements:
+                elements = driver.find_elements(By.XPATH, _REPORTS_MENU_XPATH)
+            if elements:
+                reports_menu = elements[0]
+        except:
+            pass
+
         if not reports_menu:
             # Try to find all menu items and look for one containing "Reports"
             print("Trying to find Reports menu by text content...")
@@ -509,44 +1594,41 @@ def navigate_to_district_table(driver, wait):
         if reports_menu:
             print("Clicking Reports menu...")
             driver.execute_script("arguments[0].click();", reports_menu)
-            time.sleep(2)  # Wait for submenu to appear
+            # Wait for the submenu to appear
+            try:
+                wait.until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, ".ui-menu-list a, .ui-submenu a")))
+            except TimeoutException:
+                pass
         else:
-            print("Reports menu not found. Listing available menu items:")
-            menu_items = driver.find_elements(By.TAG_NAME, "a")
-            for item in menu_items:
-                try:
-                    print(f"Menu item: {item.text} - onclick: {item.get_attribute('onclick')}")
-                except:
-                    pass
-            
+            print("Reports menu not found.")
+            if _DEBUG:
+                # Listing every link serializes the whole page's anchors
+                # over the wire — debug only
+                print("Listing available menu items:")
+                menu_items = driver.find_elements(By.TAG_NAME, "a")
+                for item in menu_items:
+                    try:
+                        print(f"Menu item: {item.text} - onclick: {item.get_attribute('onclick')}")
+                    except:
+                        pass
+
             # Try direct navigation to the reports page as fallback
             print("Trying direct navigation to reports page...")
             driver.get("https://www.tnpds.gov.in/pages/reports/pds-report-state.xhtml")
-            time.sleep(3)
+            wait_for_page_load(driver)
         
         # Look for FPS Reports submenu or check if we're already on the reports page
         if "pds-report-state.xhtml" not in driver.current_url:
             print("Looking for FPS Reports submenu...")
-            fps_reports_selectors = [
-                'a:contains("FPS Reports")',
-                'li.ui-menuitem:contains("FPS Reports") > a',
-                'a.ui-menuitem-link:contains("FPS")'
-            ]
-            
             fps_reports_menu = None
-            for selector in fps_reports_selectors:
-                try:
-                    # Try XPath
-                    if "contains" in selector:
-                        xpath = selector.replace('a:contains("', '//a[contains(text(),"').replace('")', '")]')
-                        xpath = xpath.replace('li.ui-menuitem:contains("', '//li[contains(@class,"ui-menuitem") and contains(.,"')
-                        elements = driver.find_elements(By.XPATH, xpath)
-                        if elements:
-                            fps_reports_menu = elements[0]
-                            break
-                except:
-                    continue
-            
+            try:
+                elements = driver.find_elements(By.XPATH, _FPS_REPORTS_XPATH)
+                if elements:
+                    fps_reports_menu = elements[0]
+            except:
+                pass
+
             if not fps_reports_menu:
                 # Try to find all submenu items and look for one containing "FPS"
                 submenu_items = driver.find_elements(By.CSS_SELECTOR, ".ui-menu-list a, .ui-submenu a")
@@ -559,11 +1641,11 @@ def navigate_to_district_table(driver, wait):
             if fps_reports_menu:
                 print("Clicking FPS Reports submenu...")
                 driver.execute_script("arguments[0].click();", fps_reports_menu)
-                time.sleep(3)  # Wait for page to load
+                # The fpsReportForm wait below handles the page load
             else:
                 print("FPS Reports submenu not found. Trying direct navigation...")
                 driver.get("https://www.tnpds.gov.in/pages/reports/pds-report-state.xhtml")
-                time.sleep(3)
+                wait_for_page_load(driver)
         
         # Check if we're on the reports page
         try:
@@ -572,14 +1654,12 @@ def navigate_to_district_table(driver, wait):
             return True
         except TimeoutException:
             print("Failed to navigate to FPS Reports page")
-            driver.save_screenshot("navigation_failed.png")
+            debug_screenshot(driver, "navigation_failed.png")
             return False
-    
+
     except Exception as e:
         print(f"Error navigating to PDS Reports: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        driver.save_screenshot("navigation_error.png")
+        record_err("navigate_to_district_table", e, driver)
         return False
 
 def navigate_to_taluk_level(driver, wait):
@@ -589,135 +1669,240 @@ def navigate_to_taluk_level(driver, wait):
         print("\nLooking for taluk table...")
         try:
             # Save page source for analysis
-            with open("after_district_click_source.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("Page source saved after district click")
-            
-            # Wait for the taluk table to be present - try multiple possible IDs
-            taluk_table_selectors = [
-                '[id$="TalukLevelDetailsTable"]',  # Ends with TalukLevelDetailsTable
-                '[id*="Taluk"][id*="Table"]',     # Contains both 'Taluk' and 'Table'
-                '.ui-datatable',                  # PrimeFaces datatable class
-                'table.dataTable',                # Common datatable class
-                'table:not(.ui-menu-list)'       # Any table that's not a menu
-            ]
-            
+            if _DEBUG:
+                with open("after_district_click_source.html", "w", encoding="utf-8") as f:
+                    f.write(driver.page_source)
+                print("Page source saved after district click")
+
+            # Pick the first candidate selector with a real data table in
+            # one script call
             taluk_table = None
-            for selector in taluk_table_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        # Filter out small tables that might be menus or other UI elements
-                        valid_tables = []
-                        for table in elements:
-                            try:
-                                rows = table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-                                if len(rows) > 1:  # Table should have multiple rows
-                                    valid_tables.append(table)
-                            except:
-                                continue
-                        
-                        if valid_tables:
-                            taluk_table = valid_tables[0]
-                            print(f"Found taluk table with selector: {selector}, with {len(valid_tables)} valid tables")
-                            break
-                except Exception as e:
-                    print(f"Selector {selector} failed: {str(e)}")
-                    continue
-            
+            match = pick_data_table(driver, TALUK_TABLE_SELECTORS)
+            if match:
+                taluk_table = match[1]
+                print(f"Found taluk table with selector: {match[0]}")
+
             if not taluk_table:
                 print("Could not find taluk table")
-                driver.save_screenshot("taluk_table_not_found.png")
+                debug_screenshot(driver, "taluk_table_not_found.png")
                 return False
-            
+
             # Take screenshot of taluk table
-            driver.save_screenshot("taluk_table.png")
-            print("Taluk table screenshot saved")
-            
-            # Get all taluk rows
-            rows = taluk_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-            print(f"Found {len(rows)} taluk rows")
-            
+            debug_screenshot(driver, "taluk_table.png")
+
+            # Pull the whole table's text in one JS round-trip instead of
+            # per-cell WebDriver calls
+            header_texts, cell_rows = extract_table_cells(driver, taluk_table)
+            print(f"Found {len(cell_rows)} taluk rows")
+
             # Print table structure for debugging
-            print("Table structure:")
-            headers = taluk_table.find_elements(By.CSS_SELECTOR, 'th')
-            header_texts = [h.text for h in headers]
-            print(f"Headers: {header_texts}")
-            
-            if len(rows) > 0:
-                sample_row = rows[0]
-                cells = sample_row.find_elements(By.CSS_SELECTOR, 'td')
-                cell_texts = [c.text for c in cells]
-                print(f"Sample row cells: {cell_texts}")
-            
+            if _DEBUG:
+                print("Table structure:")
+                print(f"Headers: {header_texts}")
+                if cell_rows:
+                    print(f"Sample row cells: {cell_rows[0]}")
+
             # Extract taluk data
             taluks = []
-            for row in rows:
-                try:
-                    cells = row.find_elements(By.CSS_SELECTOR, 'td')
-                    if cells:
-                        taluk_name = cells[0].text  # First column should be taluk name
-                        if taluk_name and len(taluk_name.strip()) > 0:
-                            taluks.append(taluk_name)
-                except Exception as e:
-                    print(f"Error extracting taluk name: {str(e)}")
-                    continue
-            
+            for cells in cell_rows:
+                if cells:
+                    taluk_name = cells[0]  # First column should be taluk name
+                    if taluk_name and len(taluk_name.strip()) > 0:
+                        taluks.append(taluk_name)
+
             print(f"Extracted {len(taluks)} taluk names")
             print("Taluks:", taluks[:5], "..." if len(taluks) > 5 else "")
-            
+
             # Save taluk data
-            save_data_to_json({"taluks": taluks}, "pds_taluks.json")
-            print("Taluk data saved to pds_taluks.json")
-            
+            if _DEBUG:
+                buffer_debug_json("pds_taluks.json", {"taluks": taluks})
+
             # Try clicking on the first taluk
-            if len(rows) > 0:
+            if cell_rows:
                 try:
-                    # Look for a clickable link in the first row
-                    links = rows[0].find_elements(By.TAG_NAME, 'a')
+                    # Only the clicked row needs a live element handle
+                    first_row = taluk_table.find_element(By.CSS_SELECTOR, 'tbody tr')
+                    links = first_row.find_elements(By.TAG_NAME, 'a')
                     if links:
                         first_taluk_link = links[0]
-                        taluk_name = rows[0].text.split('\n')[0] if '\n' in rows[0].text else rows[0].text
+                        taluk_name = cell_rows[0][0] if cell_rows[0] else ''
                         print(f"Clicking on first taluk: {taluk_name}")
-                        
+
                         # Click on taluk link
                         driver.execute_script("arguments[0].click();", first_taluk_link)
                     else:
                         # If no link, try clicking the row itself
                         print("No direct link found, trying to click the row")
-                        driver.execute_script("arguments[0].click();", rows[0])
+                        driver.execute_script("arguments[0].click();", first_row)
                     
-                    # Wait for page update
-                    time.sleep(2)
-                    wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+                    # Wait for the JSF postback to settle
+                    wait_for_ajax(driver, wait)
+                    wait_for_page_load(driver)
                     print("Page updated after taluk click")
                     
                     # Take screenshot after clicking taluk
-                    driver.save_screenshot("after_taluk_click.png")
-                    print("Screenshot saved after clicking taluk")
-                    
+                    debug_screenshot(driver, "after_taluk_click.png")
+
                     # Navigate to shop level
                     navigate_to_shop_level(driver, wait)
                     
                     return True
                 except Exception as e:
                     print(f"Error clicking on first taluk: {str(e)}")
-                    driver.save_screenshot("taluk_click_error.png")
+                    debug_screenshot(driver, "taluk_click_error.png")
                     return False
             else:
                 print("No taluk rows found to click")
                 return False
-                
+
+        except Exception as e:
+            print(f"Error finding taluk table: {str(e)}")
+            debug_screenshot(driver, "taluk_error.png")
+            return False
+            
+    except Exception as e:
+        print(f"Error navigating to taluk level: {str(e)}")
+        record_err("navigate_to_taluk_level", e, driver)
+        return False
+
+
+class DriverPool:
+    """
+    Bounded pool of reusable Chrome drivers.
+
+    Cold-starting Chrome costs 1-2 s, so workers borrow a warm driver and
+    put it back rather than paying that per task. Drivers are created
+    lazily up to the limit, so a small job never boots more browsers than
+    it has work; create_chrome_driver already disables images and blocks
+    analytics for each of them.
+    """
+
+    def __init__(self, size, headless=True, prewarm=False):
+        import queue
+        self._size = size
+        self._headless = headless
+        self._q = queue.Queue()
+        self._created = 0
+        self._lock = threading.Lock()
+        if prewarm:
+            self.prewarm()
+
+    def prewarm(self):
+        """
+        Boot and warm every remaining driver concurrently. A worker is only
+        useful after it has loaded the homepage and switched to English;
+        doing that serially costs size * (cold start + language waits).
+        The warmup is network-bound, so threads overlap it almost fully.
+        """
+        with self._lock:
+            missing = self._size - self._created
+            self._created = self._size
+        if missing <= 0:
+            return
+
+        def boot_one(_):
+            try:
+                driver = create_chrome_driver(headless=self._headless)
+            except Exception as e:
+                # Give the claimed slot back, otherwise acquire() blocks
+                # forever waiting for a driver that never booted
+                print(f"Warning: driver boot failed during prewarm: {str(e)}")
+                with self._lock:
+                    self._created -= 1
+                return None
+            try:
+                navigate_to_main_page(driver, WebDriverWait(driver, 10))
+            except Exception as e:
+                print(f"Warning: driver warmup failed: {str(e)}")
+            return driver
+
+        with ThreadPoolExecutor(max_workers=missing) as ex:
+            for driver in ex.map(boot_one, range(missing)):
+                if driver is not None:
+                    self._q.put(driver)
+
+    def acquire(self):
+        import queue
+        try:
+            return self._q.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self._size:
+                self._created += 1
+                return create_chrome_driver(headless=self._headless)
+        return self._q.get()
+
+    def release(self, driver):
+        self._q.put(driver)
+
+    def quit_all(self):
+        import queue
+        while True:
+            try:
+                driver = self._q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+def scrape_shop_pages_parallel(shop_urls, max_workers=5, headless=True, driver_pool=None):
+    """Scrape directly-addressable shop pages over a bounded driver pool.
+
+    Page-load latency dominates per-shop cost, so N sequential loads cost
+    N * latency while a pool of K drivers costs ~N/K * latency. Callers
+    that scrape repeatedly can pass their own DriverPool to keep the
+    browsers warm across calls (threads rather than asyncio — WebDriver
+    calls block, and the rest of the crawler is thread-based).
+    """
+    results = {}
+    results_lock = threading.Lock()
+    workers = max(1, min(max_workers, len(shop_urls)))
+    own_pool = driver_pool is None
+    if own_pool:
+        # Warm the browsers in parallel; a serial warmup would add
+        # workers * (cold start + homepage load) before any scraping
+        driver_pool = DriverPool(workers, headless=headless, prewarm=True)
+
+    def scrape_one(url):
+        worker = None
+        try:
+            worker = driver_pool.acquire()
+            worker.get(url)
+            wait_for_page_load(worker, timeout=20)
+            from lxml import html as lxml_html
+            root = lxml_html.fromstring(worker.page_source)
+            tables = []
+            for table in root.xpath('//table'):
+                headers = [c.text_content().strip() for c in table.xpath('.//th')]
+                rows = [[c.text_content().strip() for c in tr.xpath('./td')]
+                        for tr in table.xpath('.//tbody/tr')]
+                if rows:
+                    tables.append({"headers": headers, "rows": rows})
+            with results_lock:
+                results[url] = tables
         except Exception as e:
-            print(f"Error finding taluk table: {str(e)}")
-            driver.save_screenshot("taluk_error.png")
-            return False
-            
-    except Exception as e:
-        print(f"Error navigating to taluk level: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+            print(f"Error scraping shop page {url}: {str(e)}")
+            with results_lock:
+                results[url] = None
+        finally:
+            if worker is not None:
+                driver_pool.release(worker)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(scrape_one, u) for u in shop_urls]
+            for future in futures:
+                future.result()
+    finally:
+        # Only tear down browsers we booted ourselves; a caller-supplied
+        # pool stays warm for the next batch
+        if own_pool:
+            driver_pool.quit_all()
+    return results
 
 
 def navigate_to_shop_level(driver, wait):
@@ -726,124 +1911,132 @@ def navigate_to_shop_level(driver, wait):
         # Wait for shop table to load
         print("\nLooking for shop table...")
         try:
-            # Save page source for analysis
-            with open("after_taluk_click_source.html", "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            print("Page source saved after taluk click")
-            
-            # Wait for the shop table to be present - try multiple possible IDs
-            shop_table_selectors = [
-                '[id$="ShopLevelDetailsTable"]',  # Ends with ShopLevelDetailsTable
-                '[id*="Shop"][id*="Table"]',     # Contains both 'Shop' and 'Table'
-                '.ui-datatable',                 # PrimeFaces datatable class
-                'table.dataTable',               # Common datatable class
-                'table:not(.ui-menu-list)'      # Any table that's not a menu
-            ]
-            
+            # One DOM serialization per navigation, reused for the debug
+            # dump and for the lxml extraction pass below
+            page_cache = PageCache()
+            page_html = page_cache.get(driver)
+            debug_dump("after_taluk_click_source.html", page_html)
+            
+            # One script call walks all candidate selectors in priority
+            # order and picks the first table with real data rows,
+            # filtering out menus and other small UI tables in-browser —
+            # previously up to five separate DOM queries per shop page
             shop_table = None
-            for selector in shop_table_selectors:
-                try:
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        # Filter out small tables that might be menus or other UI elements
-                        valid_tables = []
-                        for table in elements:
-                            try:
-                                rows = table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-                                if len(rows) > 1:  # Table should have multiple rows
-                                    valid_tables.append(table)
-                            except:
-                                continue
-                        
-                        if valid_tables:
-                            shop_table = valid_tables[0]
-                            print(f"Found shop table with selector: {selector}, with {len(valid_tables)} valid tables")
-                            break
-                except Exception as e:
-                    print(f"Selector {selector} failed: {str(e)}")
-                    continue
+            match = pick_data_table(driver, SHOP_TABLE_SELECTORS)
+            if match:
+                print(f"Found shop table with selector: {match[0]}")
+                shop_table = match[1]
             
             if not shop_table:
                 print("Could not find shop table")
-                driver.save_screenshot("shop_table_not_found.png")
+                debug_screenshot(driver, "shop_table_not_found.png")
                 return False
-            
+
             # Take screenshot of shop table
-            driver.save_screenshot("shop_table.png")
-            print("Shop table screenshot saved")
-            
-            # Get all shop rows
-            rows = shop_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-            print(f"Found {len(rows)} shop rows")
-            
+            debug_screenshot(driver, "shop_table.png")
+            
+            # Parse headers and cells out of the already-fetched page source
+            # with lxml: every per-cell .text on a live element is its own
+            # WebDriver round-trip, so a big table costs O(rows*cols) IPC
+            # calls; parsing the HTML string in-process costs none
+            from lxml import html as lxml_html
+            doc = lxml_html.fromstring(page_html)
+            table_node = None
+            table_id = shop_table.get_attribute('id')
+            if table_id:
+                nodes = doc.xpath('//table[@id=$tid]', tid=table_id)
+                if nodes:
+                    table_node = nodes[0]
+
+            if table_node is not None:
+                header_texts = [h.text_content().strip() for h in table_node.xpath('.//th')]
+                cell_rows = [[c.text_content().strip() for c in tr.xpath('./td')]
+                             for tr in table_node.xpath('.//tbody/tr')]
+            else:
+                # Table has no id to match on — one-shot JS serializer
+                # instead of per-cell reads
+                header_texts, cell_rows = extract_table_cells(driver, shop_table)
+
+            print(f"Found {len(cell_rows)} shop rows")
+
             # Print table structure for debugging
-            print("Table structure:")
-            headers = shop_table.find_elements(By.CSS_SELECTOR, 'th')
-            header_texts = [h.text for h in headers]
-            print(f"Headers: {header_texts}")
-            
-            if len(rows) > 0:
-                sample_row = rows[0]
-                cells = sample_row.find_elements(By.CSS_SELECTOR, 'td')
-                cell_texts = [c.text for c in cells]
-                print(f"Sample row cells: {cell_texts}")
-            
-            # Extract shop data
-            shops = []
-            for row in rows:
-                try:
-                    cells = row.find_elements(By.CSS_SELECTOR, 'td')
-                    if cells:
-                        shop_data = {}
-                        for i, header in enumerate(header_texts):
-                            if i < len(cells):
-                                shop_data[header] = cells[i].text
-                        if shop_data:
-                            shops.append(shop_data)
-                except Exception as e:
-                    print(f"Error extracting shop data: {str(e)}")
-                    continue
-            
+            if _DEBUG:
+                print("Table structure:")
+                print(f"Headers: {header_texts}")
+                if cell_rows:
+                    print(f"Sample row cells: {cell_rows[0]}")
+
+            # Extract shop data — zip pairs header and cell directly,
+            # truncating at the shorter side, so no per-cell index and
+            # bounds checks
+            shops = [dict(zip(header_texts, cells)) for cells in cell_rows if cells]
+
             print(f"Extracted {len(shops)} shop records")
-            if shops:
+            if _DEBUG and shops:
                 print("Sample shop data:", shops[0])
             
-            # Save shop data
-            save_data_to_json({"shops": shops}, "pds_shops.json")
-            print("Shop data saved to pds_shops.json")
-            
+            # Save shop data (debug artifact — the real crawl results go
+            # through process_shop_list_json). Appended as JSON lines so a
+            # long crawl writes each record once instead of rewriting the
+            # whole accumulated list per taluk
+            if _DEBUG:
+                for shop in shops:
+                    append_jsonl("pds_shops.jsonl", shop)
+                print(f"Appended {len(shops)} shop records to pds_shops.jsonl")
+
+            # If the shop rows carry direct URLs, fan the pages out across a
+            # bounded driver pool. On this JSF app they are normally '#'
+            # postback links bound to the live ViewState — those cannot be
+            # loaded out of session, so the sequential click path below
+            # stays the default
+            hrefs = driver.execute_script(
+                "return Array.from(arguments[0].querySelectorAll('tbody tr a'))"
+                ".map(function(a){ return a.getAttribute('href') || ''; });",
+                shop_table)
+            shop_urls = [h for h in hrefs if h.startswith('http')]
+            if shop_urls:
+                print(f"Shop rows link to direct URLs, scraping {len(shop_urls)} pages in parallel")
+                scrape_shop_pages_parallel(shop_urls)
+                return True
+
             # Try clicking on the first shop
-            if len(rows) > 0:
+            if cell_rows:
                 try:
-                    # Look for a clickable link in the first row
-                    links = rows[0].find_elements(By.TAG_NAME, 'a')
+                    # Look for a clickable link in the first row — the only
+                    # live-element fetch left in this function
+                    links = shop_table.find_elements(
+                        By.CSS_SELECTOR, 'tbody tr:first-of-type a')
                     if links:
                         first_shop_link = links[0]
-                        shop_name = cells[0].text if cells else "Unknown"
+                        shop_name = cell_rows[0][0] if cell_rows and cell_rows[0] else "Unknown"
                         print(f"Clicking on first shop: {shop_name}")
                         
                         # Click on shop link
                         driver.execute_script("arguments[0].click();", first_shop_link)
                         
-                        # Wait for page update
-                        time.sleep(2)
-                        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+                        # Wait for page update — the AJAX in-flight counter
+                        # fires as soon as the postback settles, no sleep
+                        wait_for_page_load(driver)
+                        wait_for_ajax(driver, wait)
                         print("Page updated after shop click")
                         
                         # Take screenshot after clicking shop
-                        driver.save_screenshot("after_shop_click.png")
-                        print("Screenshot saved after shop click")
-                        
-                        # Extract shop details
-                        extract_shop_details(driver, wait)
-                        
+                        debug_screenshot(driver, "after_shop_click.png")
+
+                        # The click was a JSF postback, so the cached source
+                        # is stale even though the URL may not have changed
+                        page_cache.invalidate()
+
+                        # Extract shop details, reusing the fresh fetch
+                        extract_shop_details(driver, wait, page_source=page_cache.get(driver))
+
                         return True
                     else:
                         print("No shop links found to click")
                         return False
                 except Exception as e:
                     print(f"Error clicking on first shop: {str(e)}")
-                    driver.save_screenshot("shop_click_error.png")
+                    debug_screenshot(driver, "shop_click_error.png")
                     return False
             else:
                 print("No shop rows found to click")
@@ -851,87 +2044,93 @@ def navigate_to_shop_level(driver, wait):
                 
         except Exception as e:
             print(f"Error finding shop table: {str(e)}")
-            driver.save_screenshot("shop_error.png")
+            debug_screenshot(driver, "shop_error.png")
             return False
             
     except Exception as e:
         print(f"Error navigating to shop level: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        record_err("navigate_to_shop_level", e, driver)
         return False
 
 
-def extract_shop_details(driver, wait):
+# Headers that mark a transactions table; frozenset for O(1) membership
+# instead of a list scan per header, thousands of tables per crawl
+BILL_HEADERS = frozenset({'bill number', 'bill no', 'bill no.', 'transaction id'})
+
+def extract_shop_details(driver, wait, page_source=None):
     """Extract detailed information from a shop page"""
     try:
         print("\nExtracting shop details...")
-        
+
+        # Fetch the DOM once and parse it in-process with lxml — the old
+        # find_elements + per-cell .text walk issued a WebDriver command per
+        # cell, so a shop page with a long transaction table spent its whole
+        # wall time on round-trips rather than parsing. Callers that already
+        # hold the serialized page pass it in instead of paying for a
+        # second fetch.
+        page_html = page_source if page_source is not None else driver.page_source
+
         # Save page source for analysis
-        with open("shop_details_source.html", "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
-        print("Shop details page source saved")
-        
+        debug_dump("shop_details_source.html", page_html)
+
+        from lxml import html as lxml_html
+        root = lxml_html.fromstring(page_html)
+
         # Extract all tables on the page
         tables = {}
         table_index = 3
-        
+
         # Find all tables on the page
-        all_tables = driver.find_elements(By.CSS_SELECTOR, 'table')
+        all_tables = root.xpath('//table')
         print(f"Found {len(all_tables)} tables on the shop details page")
-        
+
         # Process each table
         for i, table in enumerate(all_tables, 1):
             try:
-                rows = table.find_elements(By.CSS_SELECTOR, 'tr')
+                rows = table.xpath('.//tr')
                 if not rows:
                     continue
-                    
+
                 # Extract headers
                 headers = []
-                header_cells = rows[0].find_elements(By.CSS_SELECTOR, 'th')
+                header_cells = rows[0].xpath('./th')
                 if header_cells:
-                    headers = [cell.text.strip() for cell in header_cells]
+                    headers = [cell.text_content().strip() for cell in header_cells]
                 else:
                     # Try to get headers from first row if no th elements
-                    header_cells = rows[0].find_elements(By.CSS_SELECTOR, 'td')
-                    headers = [cell.text.strip() for cell in header_cells]
+                    header_cells = rows[0].xpath('./td')
+                    headers = [cell.text_content().strip() for cell in header_cells]
                     
                 # If no headers found, create default column names
                 if not headers or all(not h for h in headers):
                     headers = [f"Column{j}" for j in range(len(header_cells))]
                 
                 # Check if this is a transaction table with bill numbers
-                is_transaction_table = False
-                bill_number_index = -1
-                for idx, header in enumerate(headers):
-                    if header.lower() in ['bill number', 'bill no', 'bill no.', 'transaction id']:
-                        is_transaction_table = True
-                        bill_number_index = idx
-                        break
+                bill_number_index = next(
+                    (idx for idx, header in enumerate(headers)
+                     if header.lower() in BILL_HEADERS), -1)
+                is_transaction_table = bill_number_index >= 0
                 
-                # If this is a transaction table, mark it specially
+                # Extract data rows as comprehensions over the parsed
+                # cells: column names are resolved once per table instead
+                # of re-checking bounds and placeholders per cell, and the
+                # row dicts build via zip at C speed
+                row_texts = [[cell.text_content().strip() for cell in row.xpath('./td')]
+                             for row in rows[1:]]  # Skip header row
+                width = max((len(texts) for texts in row_texts), default=0)
+                names = [(headers[j] if j < len(headers) and headers[j] else f"Column{j}")
+                         for j in range(width)]
+                row_pairs = [(texts, dict(zip(names, texts)))
+                             for texts in row_texts if texts]
+                data = [row_data for _, row_data in row_pairs]
+
+                # If this is a transaction table, collect its rows
+                # specially — branch hoisted out of the row loop
                 if is_transaction_table:
                     print(f"Found transaction table with bill numbers")
-                    tables['transactions'] = []
-                    
-                # Extract data rows
-                data = []
-                for row in rows[1:]:  # Skip header row
-                    cells = row.find_elements(By.CSS_SELECTOR, 'td')
-                    if cells:
-                        row_data = {}
-                        for j, cell in enumerate(cells):
-                            if j < len(headers):
-                                header = headers[j] or f"Column{j}"
-                                row_data[header] = cell.text.strip()
-                            else:
-                                row_data[f"Column{j}"] = cell.text.strip()
-                        data.append(row_data)
-                        
-                        # If this is a transaction row, add to transactions list
-                        if is_transaction_table and bill_number_index >= 0 and j >= bill_number_index:
-                            tables['transactions'].append(row_data)
-                
+                    tables['transactions'] = [row_data for texts, row_data in row_pairs
+                                              if len(texts) > bill_number_index]
+
                 # Add table to results
                 if data:
                     tables[f"Table{table_index}"] = data
@@ -947,13 +2146,13 @@ def extract_shop_details(driver, wait):
         print(f"Found {len(tables)} data points")
         
         # Save shop details
-        save_data_to_json(shop_details, "pds_shop_details.json")
-        print("Shop details saved to pds_shop_details.json")
+        if _DEBUG:
+            buffer_debug_json("pds_shop_details.json", shop_details)
         return True
-            
+
     except Exception as e:
         print(f"Error extracting shop details: {str(e)}")
-        driver.save_screenshot("shop_details_error.png")
+        record_err("extract_shop_details", e, driver)
         return False
 
 
@@ -963,13 +2162,11 @@ def extract_form_elements(driver):
         form_data = {}
         
         # Take screenshot of the form page
-        driver.save_screenshot("form_page.png")
-        print("Form page screenshot saved")
-        
+        debug_screenshot(driver, "form_page.png")
+
         # Save page source for analysis
-        with open("form_page_source.html", "w", encoding="utf-8") as f:
-            f.write(driver.page_source)
-        print("Form page source saved")
+        if _DEBUG:
+            debug_dump("form_page_source.html", driver.page_source)
         
         # Find all forms on the page
         forms = driver.find_elements(By.TAG_NAME, "form")
@@ -987,18 +2184,13 @@ def extract_form_elements(driver):
             "form"  # Any form as fallback
         ]
         
+        # All candidates probed in one script call, in priority order
         target_form = None
-        for selector in form_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    target_form = elements[0]
-                    print(f"Found target form with selector: {selector}, ID: {target_form.get_attribute('id')}")
-                    break
-            except Exception as e:
-                print(f"Error with selector {selector}: {str(e)}")
-                continue
-        
+        match = find_first_matching(driver, form_selectors)
+        if match:
+            target_form = match[1]
+            print(f"Found target form with selector: {match[0]}, ID: {target_form.get_attribute('id')}")
+
         if not target_form:
             print("Could not find target form")
             return None
@@ -1012,39 +2204,37 @@ def extract_form_elements(driver):
             select_id = select_elem.get_attribute("id")
             select_name = select_elem.get_attribute("name")
             print(f"Select element: ID = {select_id}, Name = {select_name}")
-            
-            select = Select(select_elem)
-            options = []
-            for opt in select.options:
-                value = opt.get_attribute("value")
-                text = opt.text.strip()
-                if text:
-                    options.append({"value": value, "text": text})
-                    print(f"  - Option: {text} (value: {value})")
-            
+
+            # All options in one script call instead of two round-trips
+            # per option
+            options = [opt for opt in dump_select(driver, select_elem) if opt["text"]]
+            for opt in options:
+                print(f"  - Option: {opt['text']} (value: {opt['value']})")
+
             form_data[select_id] = options
-        
-        # Get all buttons within the form
-        buttons = target_form.find_elements(By.CSS_SELECTOR, "button, input[type='submit']")
-        form_data["buttons"] = []
-        print(f"Found {len(buttons)} buttons in form {form_id}")
-        
-        for btn in buttons:
-            btn_id = btn.get_attribute("id")
-            btn_name = btn.get_attribute("name")
-            btn_text = btn.text or btn.get_attribute("value")
-            print(f"Button: ID = {btn_id}, Name = {btn_name}, Text = {btn_text}")
-            form_data["buttons"].append({"id": btn_id, "name": btn_name, "text": btn_text})
+
+        # Get all buttons within the form — one script call returns
+        # id/name/text for every button
+        form_data["buttons"] = driver.execute_script("""
+            return Array.from(arguments[0].querySelectorAll(
+                'button, input[type="submit"]')).map(function(b) {
+                return {id: b.id, name: b.name,
+                        text: b.textContent.trim() || b.value || ''};
+            });
+        """, target_form)
+        print(f"Found {len(form_data['buttons'])} buttons in form {form_id}")
+
+        for btn in form_data["buttons"]:
+            print(f"Button: ID = {btn['id']}, Name = {btn['name']}, Text = {btn['text']}")
         
         print("Successfully extracted form elements")
-        save_data_to_json(form_data, "pds_form_data.json")
+        if _DEBUG:
+            buffer_debug_json("pds_form_data.json", form_data)
         return form_data
-    
+
     except Exception as e:
         print(f"Error extracting form elements: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        driver.save_screenshot("form_extraction_error.png")
+        record_err("extract_form_elements", e, driver)
         return None
 
 def fill_form_and_submit(driver, wait, form_data):
@@ -1063,18 +2253,13 @@ def fill_form_and_submit(driver, wait, form_data):
             "form"  # Any form as fallback
         ]
         
+        # All candidates probed in one script call, in priority order
         target_form = None
-        for selector in form_selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    target_form = elements[0]
-                    print(f"Found target form with selector: {selector}, ID: {target_form.get_attribute('id')}")
-                    break
-            except Exception as e:
-                print(f"Error with selector {selector}: {str(e)}")
-                continue
-        
+        match = find_first_matching(driver, form_selectors)
+        if match:
+            target_form = match[1]
+            print(f"Found target form with selector: {match[0]}, ID: {target_form.get_attribute('id')}")
+
         if not target_form:
             print("Could not find target form")
             return False
@@ -1092,31 +2277,26 @@ def fill_form_and_submit(driver, wait, form_data):
             "select:first-of-type"   # First select as fallback
         ]
         
-        for selector in state_selectors:
-            try:
-                state_elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if state_elements:
-                    state_select = Select(state_elements[0])
-                    print(f"Found state dropdown with selector: {selector}")
-                    state_select_found = True
-                    break
-            except Exception as e:
-                print(f"Error with state selector {selector}: {str(e)}")
-                continue
+        match = find_first_matching(driver, state_selectors)
+        if match:
+            state_elem = match[1]
+            state_select = Select(state_elem)
+            print(f"Found state dropdown with selector: {match[0]}")
+            state_select_found = True
         
         if not state_select_found:
             # Try to find all select elements and look for one that might be state
             select_elements = target_form.find_elements(By.TAG_NAME, "select")
             for select_elem in select_elements:
                 try:
-                    select = Select(select_elem)
-                    options_text = [opt.text for opt in select.options]
+                    options_text = [opt["text"] for opt in dump_select(driver, select_elem)]
                     options_str = ", ".join(options_text[:5]) + ("..." if len(options_text) > 5 else "")
                     print(f"Select element options: {options_str}")
-                    
+
                     # Check if this might be the state dropdown
-                    if any("TAMIL" in opt.text.upper() for opt in select.options):
-                        state_select = select
+                    if any("TAMIL" in text.upper() for text in options_text):
+                        state_elem = select_elem
+                        state_select = Select(select_elem)
                         state_select_found = True
                         print(f"Found state dropdown with ID: {select_elem.get_attribute('id')}")
                         break
@@ -1128,74 +2308,94 @@ def fill_form_and_submit(driver, wait, form_data):
             print("Could not find state dropdown")
             return False
             
-        # Find Tamil Nadu option
-        state_selected = False
-        for i, option in enumerate(state_select.options):
-            if "TAMIL NADU" in option.text.upper():
-                state_select.select_by_index(i)
-                print(f"Selected state: {option.text}")
-                state_selected = True
-                break
-        
+        # Capture the dependent dropdown before touching the parent: the JSF
+        # AJAX update replaces it, so staleness of the old element marks the
+        # exact moment the re-render lands — no fixed sleep needed
+        old_district = driver.find_elements(By.ID, "fpsReportForm:district")
+
+        # Find Tamil Nadu option — option texts come back in one script
+        # call and the match is a single generator scan in Python
+        state_texts = [opt["text"] for opt in dump_select(driver, state_elem)]
+        idx = next((i for i, text in enumerate(state_texts)
+                    if "TAMIL NADU" in text.upper()), None)
+        state_selected = idx is not None
+        if state_selected:
+            state_select.select_by_index(idx)
+            print(f"Selected state: {state_texts[idx]}")
+
         if not state_selected:
             print("Could not find Tamil Nadu state option")
             return False
         
-        # Wait for AJAX update
-        time.sleep(2)
+        # Wait for the AJAX re-render instead of sleeping through it
+        if old_district:
+            try:
+                wait.until(EC.staleness_of(old_district[0]))
+            except TimeoutException:
+                pass
         wait_for_ajax(driver, wait)
-        
+
         # Step 2: Select Sivagangai district
         print("Selecting district...")
         try:
+            old_taluk = driver.find_elements(By.ID, "fpsReportForm:taluk")
             district_select = Select(wait.until(EC.element_to_be_clickable((By.ID, "fpsReportForm:district"))))
-            
+            district_texts = [opt["text"] for opt in dump_select(driver, "fpsReportForm:district")]
+
             # Find Sivagangai option
-            district_selected = False
-            for i, option in enumerate(district_select.options):
-                if "SIVAGANGAI" in option.text:
-                    district_select.select_by_index(i)
-                    print(f"Selected district: {option.text}")
-                    district_selected = True
-                    break
-            
+            idx = next((i for i, text in enumerate(district_texts)
+                        if "SIVAGANGAI" in text), None)
+            district_selected = idx is not None
+            if district_selected:
+                district_select.select_by_index(idx)
+                print(f"Selected district: {district_texts[idx]}")
+
             if not district_selected:
                 print("Could not find Sivagangai district option")
                 print("Available districts:")
-                for option in district_select.options:
-                    print(f"- {option.text}")
+                for text in district_texts:
+                    print(f"- {text}")
                 return False
             
-            # Wait for AJAX update
-            time.sleep(2)
+            # Wait for the taluk dropdown to be re-rendered
+            if old_taluk:
+                try:
+                    wait.until(EC.staleness_of(old_taluk[0]))
+                except TimeoutException:
+                    pass
             wait_for_ajax(driver, wait)
         except Exception as e:
             print(f"Error selecting district: {str(e)}")
             return False
-        
+
         # Step 3: Select Karaikudi taluk
         print("Selecting taluk...")
         try:
+            old_fps = driver.find_elements(By.ID, "fpsReportForm:fps")
             taluk_select = Select(wait.until(EC.element_to_be_clickable((By.ID, "fpsReportForm:taluk"))))
-            
+            taluk_texts = [opt["text"] for opt in dump_select(driver, "fpsReportForm:taluk")]
+
             # Find Karaikudi option
-            taluk_selected = False
-            for i, option in enumerate(taluk_select.options):
-                if "KARAIKUDI" in option.text:
-                    taluk_select.select_by_index(i)
-                    print(f"Selected taluk: {option.text}")
-                    taluk_selected = True
-                    break
-            
+            idx = next((i for i, text in enumerate(taluk_texts)
+                        if "KARAIKUDI" in text), None)
+            taluk_selected = idx is not None
+            if taluk_selected:
+                taluk_select.select_by_index(idx)
+                print(f"Selected taluk: {taluk_texts[idx]}")
+
             if not taluk_selected:
                 print("Could not find Karaikudi taluk option")
                 print("Available taluks:")
-                for option in taluk_select.options:
-                    print(f"- {option.text}")
+                for text in taluk_texts:
+                    print(f"- {text}")
                 return False
             
-            # Wait for AJAX update
-            time.sleep(2)
+            # Wait for the shop dropdown to be re-rendered
+            if old_fps:
+                try:
+                    wait.until(EC.staleness_of(old_fps[0]))
+                except TimeoutException:
+                    pass
             wait_for_ajax(driver, wait)
         except Exception as e:
             print(f"Error selecting taluk: {str(e)}")
@@ -1205,12 +2405,13 @@ def fill_form_and_submit(driver, wait, form_data):
         print("Selecting shop...")
         try:
             shop_select = Select(wait.until(EC.element_to_be_clickable((By.ID, "fpsReportForm:fps"))))
-            
+            shop_texts = [opt["text"] for opt in dump_select(driver, "fpsReportForm:fps")]
+
             # Select first non-default shop
             shop_selected = False
-            if len(shop_select.options) > 1:
+            if len(shop_texts) > 1:
                 shop_select.select_by_index(1)  # Select first non-default option
-                print(f"Selected shop: {shop_select.options[1].text}")
+                print(f"Selected shop: {shop_texts[1]}")
                 shop_selected = True
             
             if not shop_selected:
@@ -1218,7 +2419,6 @@ def fill_form_and_submit(driver, wait, form_data):
                 return False
             
             # Wait for AJAX update
-            time.sleep(2)
             wait_for_ajax(driver, wait)
         except Exception as e:
             print(f"Error selecting shop: {str(e)}")
@@ -1237,20 +2437,18 @@ def fill_form_and_submit(driver, wait, form_data):
         if search_button:
             driver.execute_script("arguments[0].click();", search_button)
             print("Clicked search button")
-            
-            # Wait for results to load
-            time.sleep(3)
-            wait_for_ajax(driver, wait)
-            
-            # Check if results loaded
+
+            # Wait directly for a result element — returns the instant the
+            # results render rather than sleeping a fixed 3 s first
             try:
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".fps-detail-container, .ui-datatable")))
+                wait.until(EC.presence_of_element_located(
+                    (By.CSS_SELECTOR, ".fps-detail-container, .ui-datatable tbody tr")))
                 print("Results loaded successfully")
-                driver.save_screenshot("results_page.png")
+                debug_screenshot(driver, "results_page.png")
                 return True
             except TimeoutException:
                 print("Results did not load within timeout")
-                driver.save_screenshot("results_timeout.png")
+                debug_screenshot(driver, "results_timeout.png")
                 return False
         else:
             print("Could not find search button")
@@ -1258,9 +2456,7 @@ def fill_form_and_submit(driver, wait, form_data):
     
     except Exception as e:
         print(f"Error filling form: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        driver.save_screenshot("form_fill_error.png")
+        record_err("fill_form_and_submit", e, driver)
         return False
 
 def extract_results(driver):
@@ -1271,142 +2467,135 @@ def extract_results(driver):
             "shopDetails": {}
         }
         
+        # One page_source fetch, parsed in-process — replaces a WebDriver
+        # round-trip per header, cell and label
+        from lxml import html as lxml_html
+        root = lxml_html.fromstring(driver.page_source)
+
         # Extract table data
-        tables = driver.find_elements(By.CSS_SELECTOR, "table[role='grid']")
-        for table_idx, table in enumerate(tables):
-            # Get headers
-            headers = []
-            header_cells = table.find_elements(By.TAG_NAME, "th")
-            for cell in header_cells:
-                headers.append(cell.text.strip())
-            
-            # Get rows
-            rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-            for row in rows:
-                row_data = {}
-                cells = row.find_elements(By.TAG_NAME, "td")
-                
-                for i, cell in enumerate(cells):
-                    if i < len(headers):
-                        header = headers[i] or f"Column{i}"
-                        row_data[header] = cell.text.strip()
-                
+        for table in root.xpath("//table[@role='grid']"):
+            # Get headers, substituting placeholder names once up front
+            headers = [cell.text_content().strip() or f"Column{i}"
+                       for i, cell in enumerate(table.xpath('.//th'))]
+
+            # Get rows — zip pairs header and cell without index checks
+            for row in table.xpath('.//tbody/tr'):
+                row_data = dict(zip(headers, (cell.text_content().strip()
+                                              for cell in row.xpath('./td'))))
                 if row_data:
                     results_data["tableData"].append(row_data)
-        
+
         # Extract shop details
-        detail_containers = driver.find_elements(By.CSS_SELECTOR, ".fps-detail-container")
-        for container in detail_containers:
-            labels = container.find_elements(By.TAG_NAME, "label")
-            for label in labels:
+        for container in root.xpath("//*[contains(@class, 'fps-detail-container')]"):
+            for label in container.xpath('.//label'):
                 try:
-                    key = label.text.strip().replace(":", "")
-                    # Get the next sibling which contains the value
-                    value_element = driver.execute_script("return arguments[0].nextElementSibling;", label)
-                    value = value_element.text.strip() if value_element else ""
+                    key = label.text_content().strip().replace(":", "")
+                    # The next sibling contains the value
+                    value_element = label.getnext()
+                    value = value_element.text_content().strip() if value_element is not None else ""
                     if key and value:
                         results_data["shopDetails"][key] = value
                 except Exception as e:
                     pass
         
         print("Successfully extracted results")
-        save_data_to_json(results_data, "pds_results.json")
+        if _DEBUG:
+            buffer_debug_json("pds_results.json", results_data)
         return results_data
     except Exception as e:
         print(f"Error extracting results: {str(e)}")
-        import traceback
+        record_err("extract_results", e, driver)
         return None
 
-def navigate_to_main_page(driver, wait):
-    """Navigate to the main page of the Tamil Nadu PDS website"""
-    try:
-        # Go to homepage
-        print("Loading main page...")
-        driver.get("https://www.tnpds.gov.in")
-        
-        # Wait for page to load
-        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-        print("Main page loaded")
-        
-        # Switch to English
-        if switch_to_english(driver, wait):
-            print("Successfully switched to English")
-            return True
-        else:
-            print("Failed to switch to English")
-            return False
-    except Exception as e:
-        print(f"Error navigating to main page: {str(e)}")
-        driver.save_screenshot("main_page_error.png")
-        return False
+# Compiled once — check_navigation_state runs after every navigation step
+_BREADCRUMB_MARKER_RE = re.compile(r"Details Displayed for")
 
-def check_navigation_state(driver, wait, expected_level, district=None, taluk=None):
-    """
-    Check if we're on the expected navigation level
-    expected_level: 'state', 'district', 'taluk', or 'shop'
-    """
+# check_navigation_state runs as a guard at several points per page. The
+# DOM fetch itself cannot be skipped on this JSF app (postbacks rewrite
+# the page without changing the URL), but the lxml parse and the verdict
+# are memoized on the fetched source, so repeated checks of an unchanged
+# page cost only the fetch
+_NAV_STATE_CACHE = {}
+_NAV_STATE_LOCK = threading.Lock()
+_NAV_STATE_CACHE_MAX = 64
+
+def _check_navigation_state_impl(src, expected_level, district=None, taluk=None):
+    """Pure level check against an already-fetched page source"""
+    from lxml import html as lxml_html
+    root = lxml_html.fromstring(src)
+
+    # Look for breadcrumb to determine current level; the compiled
+    # regex scan on the raw source skips the XPath walk entirely when
+    # no breadcrumb is present
     try:
-        # Wait for page to be fully loaded
-        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-        time.sleep(1)
-        
-        # Look for breadcrumb to determine current level
-        try:
-            breadcrumb_xpath = "//p[contains(text(), 'Details Displayed for')]"
-            breadcrumb = driver.find_element(By.XPATH, breadcrumb_xpath)
-            if breadcrumb:
-                links = breadcrumb.find_elements(By.TAG_NAME, "a")
-                text = breadcrumb.text
-                
+        if _BREADCRUMB_MARKER_RE.search(src):
+            crumbs = root.xpath("//p[contains(text(), 'Details Displayed for')]")
+            if crumbs:
+                links = crumbs[0].xpath('.//a')
+                text = crumbs[0].text_content()
+
                 # Check navigation level based on breadcrumb content
                 if expected_level == 'state':
                     # Should only have Tamil Nadu in breadcrumb
                     return len(links) <= 1 and 'Tamil Nadu' in text
                 elif expected_level == 'district':
                     # Should have Tamil Nadu and district in breadcrumb
-                    return len(links) == 2 and district and district in text
+                    return len(links) == 2 and bool(district) and district in text
                 elif expected_level == 'taluk':
                     # Should have Tamil Nadu, district, and taluk in breadcrumb
-                    return len(links) == 3 and district and taluk and district in text and taluk in text
+                    return len(links) == 3 and bool(district and taluk) and district in text and taluk in text
                 elif expected_level == 'shop':
                     # Should have Tamil Nadu, district, taluk, and shop ID in breadcrumb
-                    return len(links) == 3 and district and taluk and district in text and taluk in text
-        except:
-            pass
-        
-        # Check based on page content/elements
-        if expected_level == 'state':
-            try:
-                # State level has district table
-                state_table = driver.find_element(By.ID, 'StateLevelDetailsForm:StateLevelDetailsTable')
-                return True
-            except:
-                pass
-        elif expected_level == 'district':
-            try:
-                # District level has taluk table
-                taluk_table = driver.find_element(By.CSS_SELECTOR, '.ui-datatable')
-                # Check if district name is in page title or header
-                return district and district in driver.page_source
-            except:
-                pass
-        elif expected_level == 'taluk':
-            try:
-                # Taluk level has shop table
-                shop_table = driver.find_element(By.CSS_SELECTOR, '.ui-datatable')
-                # Check if taluk name is in page title or header
-                return taluk and taluk in driver.page_source
-            except:
-                pass
-        elif expected_level == 'shop':
-            try:
-                # Shop level has multiple data tables
-                tables = driver.find_elements(By.CSS_SELECTOR, '.ui-datatable')
-                return len(tables) >= 3  # Shop pages typically have multiple tables
-            except:
-                pass
-                
-        return False
+                    return len(links) == 3 and bool(district and taluk) and district in text and taluk in text
+    except:
+        pass
+
+    # Check based on page content/elements, all against the already-
+    # fetched source
+    if expected_level == 'state':
+        # State level has district table
+        if root.xpath("//table[@id='StateLevelDetailsForm:StateLevelDetailsTable']"):
+            return True
+    elif expected_level == 'district':
+        # District level has taluk table; district name should appear
+        # in the page
+        if root.xpath("//*[contains(@class, 'ui-datatable')]"):
+            return bool(district) and district in src
+    elif expected_level == 'taluk':
+        # Taluk level has shop table; taluk name should appear in the
+        # page
+        if root.xpath("//*[contains(@class, 'ui-datatable')]"):
+            return bool(taluk) and taluk in src
+    elif expected_level == 'shop':
+        # Shop level has multiple data tables
+        return len(root.xpath("//*[contains(@class, 'ui-datatable')]")) >= 3
+
+    return False
+
+def check_navigation_state(driver, wait, expected_level, district=None, taluk=None):
+    """
+    Check if we're on the expected navigation level
+    expected_level: 'state', 'district', 'taluk', or 'shop'
+    """
+    try:
+        # Wait for page to be fully loaded
+        wait_for_page_load(driver)
+
+        # One DOM serialization covers the whole check; identical source
+        # means an identical verdict, so look it up before parsing
+        src = driver.page_source
+        key = (hash(src), expected_level, district, taluk)
+        with _NAV_STATE_LOCK:
+            if key in _NAV_STATE_CACHE:
+                return _NAV_STATE_CACHE[key]
+
+        verdict = _check_navigation_state_impl(src, expected_level, district, taluk)
+
+        with _NAV_STATE_LOCK:
+            if len(_NAV_STATE_CACHE) >= _NAV_STATE_CACHE_MAX:
+                _NAV_STATE_CACHE.clear()
+            _NAV_STATE_CACHE[key] = verdict
+        return verdict
     except Exception as e:
         print(f"Error checking navigation state: {str(e)}")
         return False
@@ -1417,9 +2606,9 @@ def navigate_to_main_page(driver, wait):
     """
     try:
         print("Navigating to main page...")
+        preset_english_locale(driver)
         driver.get("https://www.tnpds.gov.in")
-        time.sleep(2)
-        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+        wait_for_page_load(driver)
         
         # Switch to English if needed
         switch_to_english(driver, wait)
@@ -1484,16 +2673,18 @@ def navigate_to_pds_reports(driver, wait):
             except Exception as e:
                 print(f"Could not find PDS Reports by XPath: {str(e)}")
             
-            # Method 4: Try to find by looking at all links
+            # Method 4: Scan candidate links only — a targeted XPath keeps
+            # the browser from serializing every anchor on the page
             try:
-                print("Trying to find PDS Reports by scanning all links...")
-                all_links = driver.find_elements(By.TAG_NAME, "a")
-                print(f"Found {len(all_links)} links on page")
-                
+                print("Trying to find PDS Reports by scanning candidate links...")
+                all_links = driver.find_elements(
+                    By.XPATH,
+                    "//a[contains(.,'PDS') or contains(.,'pds') or contains(.,'Report') or contains(.,'report')]")
+                print(f"Found {len(all_links)} candidate links on page")
+
                 for link in all_links:
                     try:
                         link_text = link.text.strip().lower()
-                        print(f"Link text: '{link_text}'")
                         if 'pds' in link_text or 'report' in link_text:
                             print(f"Found potential match: '{link_text}'")
                             link.click()
@@ -1535,6 +2726,7 @@ def navigate_to_pds_reports(driver, wait):
 
 def navigate_to_pds_reports_and_get_districts(driver, wait):
     """Navigate to PDS Reports page and extract district data"""
+    global _DISTRICT_CACHE, _DISTRICT_SIG
     max_retries = 3
     for attempt in range(max_retries):
         try:
@@ -1542,8 +2734,7 @@ def navigate_to_pds_reports_and_get_districts(driver, wait):
             if attempt > 0:
                 print(f"Retry attempt {attempt+1}/{max_retries}")
                 navigate_to_main_page(driver, wait)
-                time.sleep(2)
-            
+
             # Navigate to PDS Reports page
             if navigate_to_pds_reports(driver, wait):
                 print("Successfully navigated to PDS Reports page")
@@ -1553,10 +2744,10 @@ def navigate_to_pds_reports_and_get_districts(driver, wait):
                     return None
                 else:
                     continue
-                    
+
             # Wait for page to load
-            time.sleep(2)
-            wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+            wait_for_page_load(driver)
+            wait_for_ajax(driver, wait)
             print("PDS Reports page loaded")
             
             # Look for district table
@@ -1567,25 +2758,40 @@ def navigate_to_pds_reports_and_get_districts(driver, wait):
                     (By.ID, 'StateLevelDetailsForm:StateLevelDetailsTable')
                 ))
                 print("Found district table")
-                
-                # Extract district data
-                rows = district_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-                print(f"Found {len(rows)} district rows")
-                
-                districts = []
-                for row in rows:
-                    try:
-                        district_cell = row.find_element(By.CSS_SELECTOR, 'td:first-child')
-                        district_name = district_cell.text.strip()
-                        if district_name:
-                            districts.append(district_name)
-                    except Exception as e:
-                        print(f"Error extracting district: {str(e)}")
-                
+
+                # The listing is static within a run, so serve it from the
+                # run-level cache when warm — main's reset paths call back
+                # in here repeatedly, and each re-scrape is pure overhead.
+                # Navigation above still happens: callers need the state
+                # table on screen to click into a district. A one-call
+                # structural fingerprint guards the hit: if the live table's
+                # shape no longer matches the one the cache came from, fall
+                # through and re-extract.
+                sig = driver.execute_script(
+                    "var t = document.getElementById('StateLevelDetailsForm:StateLevelDetailsTable');"
+                    " return t && t.tBodies.length"
+                    " ? t.tBodies[0].rows.length + ':' + t.tBodies[0].innerHTML.length : null;")
+                with _LISTING_CACHE_LOCK:
+                    cached = _DISTRICT_CACHE
+                    cached_sig = _DISTRICT_SIG
+                if cached is not None and (sig is None or cached_sig is None or sig == cached_sig):
+                    print(f"Using cached district list ({len(cached)} districts)")
+                    return list(cached)
+
+                # Extract district data in one script call — the per-row
+                # find_element/.text pattern costs two round-trips per district
+                _, cell_rows = extract_table_cells(driver, district_table)
+                print(f"Found {len(cell_rows)} district rows")
+
+                districts = [cells[0] for cells in cell_rows if cells and cells[0]]
+
                 print(f"Extracted {len(districts)} districts")
                 if districts:
                     print(f"Sample districts: {districts[:3]}" + ("..." if len(districts) > 3 else ""))
-                
+                    with _LISTING_CACHE_LOCK:
+                        _DISTRICT_CACHE = list(districts)
+                        _DISTRICT_SIG = sig
+
                 return districts
                 
             except Exception as e:
@@ -1604,99 +2810,69 @@ def navigate_to_pds_reports_and_get_districts(driver, wait):
     
     return None
 
-def navigate_to_district_and_get_taluks(driver, wait, district_name):
-    """Navigate to a specific district and extract taluk data"""
+def click_district_link(driver, wait, district_name):
+    """Click a district's link in the state-level table to descend into it"""
     try:
         # Find district table
         print(f"Looking for district table to find {district_name}...")
         district_table = wait.until(EC.presence_of_element_located(
             (By.ID, 'StateLevelDetailsForm:StateLevelDetailsTable')
         ))
-        
-        # Find the row with the target district
-        rows = district_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-        district_row = None
-        district_link = None
-        
-        for row in rows:
-            try:
-                cell = row.find_element(By.CSS_SELECTOR, 'td:first-child')
-                if cell.text.strip().lower() == district_name.lower():
-                    district_row = row
-                    # Find the link in this row
-                    district_link = cell.find_element(By.TAG_NAME, 'a')
-                    break
-            except Exception as e:
-                continue
-        
-        if not district_link:
-            print(f"Could not find district: {district_name}")
-            return None
-        
-        # Click on the district link
+
+        # Locate the matching row and click its link in one script call —
+        # the Python row search cost two round-trips per district
         print(f"Clicking on district: {district_name}")
+        if not click_row_link_by_text(driver, district_table, district_name):
+            print(f"Could not find district: {district_name}")
+            return False
+
+        # Wait for the JSF update instead of a fixed sleep: the state table
+        # we clicked in goes stale when the postback swaps the DOM, then the
+        # taluk table appears
         try:
-            driver.execute_script("arguments[0].click();", district_link)
-        except Exception as e:
-            print(f"Error clicking district link: {str(e)}")
-            return None
-        
-        # Wait for page to load
-        time.sleep(2)
-        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+            wait.until(EC.staleness_of(district_table))
+        except TimeoutException:
+            pass
+        wait_for_ajax(driver, wait)
+        wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, '[id$="TalukLevelDetailsTable"], .ui-datatable')))
         print("Page updated after district click")
-        
+        return True
+
+    except Exception as e:
+        print(f"Error navigating to district: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def navigate_to_district_and_get_taluks(driver, wait, district_name):
+    """Navigate to a specific district and extract taluk data"""
+    try:
+        if not click_district_link(driver, wait, district_name):
+            return None
+
         # Look for taluk table
         print("Looking for taluk table...")
         try:
             
-            # Try multiple possible selectors for the taluk table
-            taluk_table_selectors = [
-                '[id$="TalukLevelDetailsTable"]',  # Ends with TalukLevelDetailsTable
-                '[id*="Taluk"][id*="Table"]',     # Contains both 'Taluk' and 'Table'
-                '.ui-datatable',                  # PrimeFaces datatable class
-                'table.dataTable',                # Common datatable class
-                'table:not(.ui-menu-list)'       # Any table that's not a menu
-            ]
-            
+            # Pick the first selector with a real data table in one script
+            # call instead of a find_elements + row-count pass per selector
             taluk_table = None
-            for selector in taluk_table_selectors:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    # Filter out small tables that might be menus or other UI elements
-                    valid_tables = []
-                    for table in elements:
-                        try:
-                            rows = table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-                            if len(rows) > 1:  # Table should have multiple rows
-                                valid_tables.append(table)
-                        except:
-                            continue
-                    
-                    if valid_tables:
-                        taluk_table = valid_tables[0]
-                        print(f"Found taluk table with selector: {selector}")
-                        break
-            
+            match = pick_data_table(driver, TALUK_TABLE_SELECTORS)
+            if match:
+                taluk_table = match[1]
+                print(f"Found taluk table with selector: {match[0]}")
+
             if not taluk_table:
                 print("Could not find taluk table")
                 return None
             
-            # Extract taluk data
-            rows = taluk_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-            print(f"Found {len(rows)} taluk rows")
-            
-            taluks = []
-            for row in rows:
-                try:
-                    cells = row.find_elements(By.CSS_SELECTOR, 'td')
-                    if cells:
-                        taluk_name = cells[0].text.strip()
-                        if taluk_name:
-                            taluks.append(taluk_name)
-                except Exception as e:
-                    print(f"Error extracting taluk name: {str(e)}")
-            
+            # Extract taluk data in one script call instead of per-row round-trips
+            _, cell_rows = extract_table_cells(driver, taluk_table)
+            print(f"Found {len(cell_rows)} taluk rows")
+
+            taluks = [cells[0] for cells in cell_rows if cells and cells[0]]
+
             print(f"Extracted {len(taluks)} taluks")
             if taluks:
                 print(f"Sample taluks: {taluks[:3]}" + ("..." if len(taluks) > 3 else ""))
@@ -1722,133 +2898,59 @@ def navigate_to_taluk_and_get_shops(driver, wait, taluk_name):
         # Find taluk table
         print(f"Looking for taluk table to find {taluk_name}...")
         
-        # Try multiple possible selectors for the taluk table
-        taluk_table_selectors = [
-            '[id$="TalukLevelDetailsTable"]',  # Ends with TalukLevelDetailsTable
-            '[id*="Taluk"][id*="Table"]',     # Contains both 'Taluk' and 'Table'
-            '.ui-datatable',                  # PrimeFaces datatable class
-            'table.dataTable',                # Common datatable class
-            'table:not(.ui-menu-list)'       # Any table that's not a menu
-        ]
-        
+        # Pick the first selector with a real data table in one script call
         taluk_table = None
-        for selector in taluk_table_selectors:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            if elements:
-                # Filter out small tables
-                valid_tables = []
-                for table in elements:
-                    try:
-                        rows = table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-                        if len(rows) > 1:  # Table should have multiple rows
-                            valid_tables.append(table)
-                    except:
-                        continue
-                
-                if valid_tables:
-                    taluk_table = valid_tables[0]
-                    print(f"Found taluk table with selector: {selector}")
-                    break
-        
+        match = pick_data_table(driver, TALUK_TABLE_SELECTORS)
+        if match:
+            taluk_table = match[1]
+            print(f"Found taluk table with selector: {match[0]}")
+
         if not taluk_table:
             print("Could not find taluk table")
             return None
         
-        # Find the row with the target taluk
-        rows = taluk_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-        taluk_row = None
-        taluk_link = None
-        
-        for row in rows:
-            try:
-                cells = row.find_elements(By.CSS_SELECTOR, 'td')
-                if cells and cells[0].text.strip().lower() == taluk_name.lower():
-                    taluk_row = row
-                    # Find the link in this row
-                    links = row.find_elements(By.TAG_NAME, 'a')
-                    if links:
-                        taluk_link = links[0]
-                    break
-            except Exception as e:
-                continue
-        
-        if not taluk_link:
+        # Locate the matching row and click its link in one script call
+        print(f"Clicking on taluk: {taluk_name}")
+        if not click_row_link_by_text(driver, taluk_table, taluk_name):
             print(f"Could not find taluk: {taluk_name}")
             return None
-        
-        # Click on the taluk link
-        print(f"Clicking on taluk: {taluk_name}")
+
+        # Wait for the JSF update instead of a fixed sleep: the taluk table
+        # goes stale when the postback swaps the DOM, then the shop table
+        # appears
         try:
-            driver.execute_script("arguments[0].click();", taluk_link)
-        except Exception as e:
-            print(f"Error clicking taluk link: {str(e)}")
-            return None
-        
-        # Wait for page to load
-        time.sleep(2)
-        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+            wait.until(EC.staleness_of(taluk_table))
+        except TimeoutException:
+            pass
+        wait_for_ajax(driver, wait)
+        wait.until(EC.presence_of_element_located(
+            (By.CSS_SELECTOR, '[id$="ShopLevelDetailsTable"], .ui-datatable')))
         print("Page updated after taluk click")
         
         # Look for shop table
         print("Looking for shop table...")
         try:
             
-            # Try multiple possible selectors for the shop table
-            shop_table_selectors = [
-                '[id$="ShopLevelDetailsTable"]',  # Ends with ShopLevelDetailsTable
-                '[id*="Shop"][id*="Table"]',     # Contains both 'Shop' and 'Table'
-                '.ui-datatable',                 # PrimeFaces datatable class
-                'table.dataTable',               # Common datatable class
-                'table:not(.ui-menu-list)'      # Any table that's not a menu
-            ]
-            
+            # Pick the first selector with a real data table in one script call
             shop_table = None
-            for selector in shop_table_selectors:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements:
-                    # Filter out small tables
-                    valid_tables = []
-                    for table in elements:
-                        try:
-                            rows = table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-                            if len(rows) > 1:  # Table should have multiple rows
-                                valid_tables.append(table)
-                        except:
-                            continue
-                    
-                    if valid_tables:
-                        shop_table = valid_tables[0]
-                        print(f"Found shop table with selector: {selector}")
-                        break
-            
+            match = pick_data_table(driver, SHOP_TABLE_SELECTORS)
+            if match:
+                shop_table = match[1]
+                print(f"Found shop table with selector: {match[0]}")
+
             if not shop_table:
                 print("Could not find shop table")
                 return None
             
-            # Extract shop data
-            rows = shop_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-            print(f"Found {len(rows)} shop rows")
-            
-            # Get headers
-            headers = shop_table.find_elements(By.CSS_SELECTOR, 'th')
-            header_texts = [h.text.strip() for h in headers]
+            # Extract headers and rows in one script call — the nested
+            # per-cell loop was O(rows * columns) WebDriver round-trips
+            header_texts, cell_rows = extract_table_cells(driver, shop_table)
+            print(f"Found {len(cell_rows)} shop rows")
             print(f"Shop table headers: {header_texts}")
-            
-            shops = []
-            for row in rows:
-                try:
-                    cells = row.find_elements(By.CSS_SELECTOR, 'td')
-                    if cells:
-                        shop_data = {}
-                        for i, cell in enumerate(cells):
-                            if i < len(header_texts):
-                                header = header_texts[i] if header_texts[i] else f"Column{i}"
-                                shop_data[header] = cell.text.strip()
-                        if shop_data:
-                            shops.append(shop_data)
-                except Exception as e:
-                    print(f"Error extracting shop data: {str(e)}")
-            
+
+            names = [h if h else f"Column{i}" for i, h in enumerate(header_texts)]
+            shops = [dict(zip(names, cells)) for cells in cell_rows if cells]
+
             print(f"Extracted {len(shops)} shops")
             if shops:
                 print(f"Sample shop: {shops[0]}")
@@ -1876,53 +2978,39 @@ def navigate_back_using_breadcrumbs(driver, wait, level):
         print(f"Attempting to navigate back to {level} level using breadcrumbs...")
         
         # Wait for page to be fully loaded
-        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-        time.sleep(1)
-        
-        # First try the specific Tamil Nadu PDS format with the "Details Displayed for" text
+        wait_for_page_load(driver)
+
+        # First try the specific Tamil Nadu PDS format with the "Details
+        # Displayed for" text. Finding the paragraph, listing its links and
+        # clicking the right one happens in a single script call — the old
+        # path paid a round-trip per link just to print its text/onclick
+        # before clicking via JavaScript anyway
         try:
-            # Using XPath to find the paragraph with "Details Displayed for" text
-            breadcrumb_xpath = "//p[contains(text(), 'Details Displayed for')]" 
-            breadcrumb = driver.find_element(By.XPATH, breadcrumb_xpath)
-            
-            if breadcrumb:
-                print("Found Tamil Nadu PDS breadcrumb navigation")
-                links = breadcrumb.find_elements(By.TAG_NAME, "a")
-                
-                # Debug info
-                print(f"Found {len(links)} links in breadcrumb")
-                for i, link in enumerate(links):
-                    print(f"Link {i}: {link.text} - {link.get_attribute('onclick')}")
-                
-                target_link = None
-                if level == 'state':
-                    # Tamil Nadu link (first)
-                    if links and len(links) > 0:
-                        target_link = links[0]
-                elif level == 'district':
-                    # District link (second)
-                    if links and len(links) > 1:
-                        target_link = links[1]
-                elif level == 'taluk':
-                    # Taluk link (third)
-                    if links and len(links) > 2:
-                        target_link = links[2]
-                
-                if target_link:
-                    print(f"Clicking on {level} breadcrumb link: {target_link.text}")
-                    try:
-                        # Use JavaScript to click since these are JSF links with onclick handlers
-                        driver.execute_script("arguments[0].click();", target_link)
-                        time.sleep(3)  # Give more time for JSF page update
-                        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-                        print(f"Successfully navigated back to {level} level")
-                        return True
-                    except Exception as e:
-                        print(f"Error clicking breadcrumb link: {str(e)}")
-                else:
-                    print(f"Could not find {level} link in breadcrumb")
-                
-                return False
+            clicked = driver.execute_script("""
+                var ps = document.querySelectorAll('p');
+                var p = null;
+                for (var i = 0; i < ps.length; i++) {
+                    if (ps[i].textContent.indexOf('Details Displayed for') !== -1) {
+                        p = ps[i];
+                        break;
+                    }
+                }
+                if (!p) { return false; }
+                var links = p.querySelectorAll('a');
+                var idx = {state: 0, district: 1, taluk: 2}[arguments[0]];
+                if (idx !== undefined && links.length > idx) {
+                    links[idx].click();
+                    return true;
+                }
+                return false;
+            """, level)
+            if clicked:
+                # Wait for the JSF update to land instead of a fixed sleep
+                wait_for_ajax(driver, wait)
+                wait_for_page_load(driver)
+                print(f"Successfully navigated back to {level} level")
+                return True
+            print(f"Could not find {level} link in Tamil Nadu PDS breadcrumb")
         except Exception as e:
             print(f"Error finding Tamil Nadu PDS breadcrumb: {str(e)}")
         
@@ -1954,8 +3042,8 @@ def navigate_back_using_breadcrumbs(driver, wait, level):
                         print(f"Clicking on {level} breadcrumb link: {target_link.text}")
                         try:
                             driver.execute_script("arguments[0].click();", target_link)
-                            time.sleep(2)
-                            wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+                            wait_for_ajax(driver, wait)
+                            wait_for_page_load(driver)
                             print(f"Successfully navigated back to {level} level")
                             return True
                         except Exception as e:
@@ -1974,6 +3062,43 @@ def navigate_back_using_breadcrumbs(driver, wait, level):
         print(f"Error navigating back using breadcrumbs: {str(e)}")
         return False
 
+def visit_shop_via_taluk(driver, wait, shop_id, district, taluk, output_dir, shop_name_from_search=None):
+    """
+    Hop from a shop-details page to the next shop under the same taluk.
+
+    The bulk helpers run back-to-back with no Python-side filtering in
+    between: one script call clicks the taluk breadcrumb, one presence
+    wait picks up the restored shop table, and the shop click inside
+    navigate_to_shop_and_get_details resolves through the cached row
+    index. Falls back to the full district->taluk re-navigation when the
+    breadcrumb is missing.
+    """
+    returned = False
+    if navigate_back_using_breadcrumbs(driver, wait, 'taluk'):
+        try:
+            wait.until(EC.presence_of_element_located(
+                (By.CSS_SELECTOR, '[id$="ShopLevelDetailsTable"], .ui-datatable')))
+            # Trust the breadcrumb hop only after the state check confirms
+            # we actually landed on this taluk's shop table
+            returned = check_navigation_state(driver, wait, 'taluk',
+                                              district=district, taluk=taluk)
+        except TimeoutException:
+            returned = False
+    if not returned:
+        if not navigate_to_district_and_get_taluks(driver, wait, district):
+            return False
+        if not navigate_to_taluk_and_get_shops(driver, wait, taluk):
+            return False
+    return navigate_to_shop_and_get_details(driver, wait, shop_id, district, taluk,
+                                            output_dir, shop_name_from_search)
+
+# Maps (district, taluk) -> {cell text (lower): row index} for the taluk's
+# shop table, so consecutive shops under the same taluk click by index
+# instead of re-searching the table. The report tables are static within a
+# crawl, so a populated index stays valid for the run.
+_TALUK_SHOP_INDEX_CACHE = {}
+_SHOP_INDEX_LOCK = threading.Lock()
+
 def navigate_to_shop_and_get_details(driver, wait, shop_id, district, taluk, output_dir, shop_name_from_search=None):
     """Navigate to a specific shop, extract detailed shop data, save JSON details, and navigate back using breadcrumbs"""
     try:
@@ -1983,175 +3108,222 @@ def navigate_to_shop_and_get_details(driver, wait, shop_id, district, taluk, out
         os.makedirs(screenshots_dir, exist_ok=True)
 
         # Find shop table
-        print(f"Looking for shop table to find shop ID: {shop_id}...")
-
-        # Try multiple possible selectors for the shop table
-        shop_table_selectors = [
-            '[id$="ShopLevelDetailsTable"]',  # Ends with ShopLevelDetailsTable
-            '[id*="Shop"][id*="Table"]',     # Contains both 'Shop' and 'Table'
-            '.ui-datatable',                 # PrimeFaces datatable class
-            'table.dataTable',               # Common datatable class
-            'table:not(.ui-menu-list)'      # Any table that's not a menu
-        ]
-        
+        log.info(f"Looking for shop table to find shop ID: {shop_id}...")
+
+        # Pick the first selector with a real data table in one script call
         shop_table = None
-        for selector in shop_table_selectors:
-            elements = driver.find_elements(By.CSS_SELECTOR, selector)
-            if elements:
-                # Filter out small tables
-                valid_tables = []
-                for table in elements:
-                    try:
-                        rows = table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-                        if len(rows) > 1:  # Table should have multiple rows
-                            valid_tables.append(table)
-                    except:
-                        continue
-                
-                if valid_tables:
-                    shop_table = valid_tables[0]
-                    print(f"Found shop table with selector: {selector}")
-                    break
-        
+        match = pick_data_table(driver, SHOP_TABLE_SELECTORS)
+        if match:
+            shop_table = match[1]
+            log.info(f"Found shop table with selector: {match[0]}")
+
         if not shop_table:
-            print("Could not find shop table")
+            log.info("Could not find shop table")
             driver.save_screenshot(os.path.join(screenshots_dir, "shop_table_not_found.png"))
             return False
         
-        # Find the row with the target shop ID
-        rows = shop_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-        shop_row = None
-        shop_link = None
-        
-        for row in rows:
+        # Resolve the shop's row index, from the per-taluk cache when warm.
+        # The first shop under a taluk extracts the whole table once and
+        # indexes every cell text; consecutive shops under the same taluk
+        # skip the search entirely and click straight by row index.
+        cache_key = (district, taluk)
+        with _SHOP_INDEX_LOCK:
+            entry = _TALUK_SHOP_INDEX_CACHE.get(cache_key)
+        if entry is None:
+            _, cell_rows = extract_table_cells(driver, shop_table)
+            shop_index = {}
+            for i, cells in enumerate(cell_rows):
+                for text in cells:
+                    shop_index.setdefault(text.lower(), i)
+            # Grab each row's JSF onclick handler alongside the text: the
+            # handlers are deterministic mojarra.jsfcljs(...) strings, so a
+            # later visit can replay one directly without any element lookup
+            onclicks = driver.execute_script("""
+                return Array.from(arguments[0].querySelectorAll('tbody tr')).map(function(r) {
+                    var a = r.querySelector('a');
+                    return a ? a.getAttribute('onclick') : null;
+                });
+            """, shop_table)
+            entry = {"index": shop_index, "onclicks": onclicks}
+            with _SHOP_INDEX_LOCK:
+                _TALUK_SHOP_INDEX_CACHE[cache_key] = entry
+        shop_index = entry["index"]
+        onclicks = entry["onclicks"]
+
+        needle = shop_id.lower()
+        row_idx = shop_index.get(needle)
+        if row_idx is None:
+            # Fall back to the old substring match against every cell
+            row_idx = next((idx for text, idx in shop_index.items() if needle in text), None)
+
+        clicked = False
+        if row_idx is None:
+            # Last resort: scan the live table in-browser and click in the
+            # same call — the cached snapshot may predate a table refresh.
+            # Still one round-trip, versus the old O(rows * cells) Python scan.
+            clicked = driver.execute_script("""
+                var id = arguments[1].toLowerCase();
+                var rows = arguments[0].querySelectorAll('tbody tr');
+                for (var i = 0; i < rows.length; i++) {
+                    var r = rows[i];
+                    for (var j = 0; j < r.cells.length; j++) {
+                        if (r.cells[j].innerText.toLowerCase().indexOf(id) !== -1) {
+                            var a = r.querySelector('a');
+                            if (a) { a.click(); return true; }
+                        }
+                    }
+                }
+                return false;
+            """, shop_table, shop_id)
+            if not clicked:
+                log.info(f"Could not find shop with ID: {shop_id}")
+                driver.save_screenshot(os.path.join(screenshots_dir, "shop_not_found.png"))
+                return False
+
+        # Navigate by replaying the cached onclick handler through CDP —
+        # no element lookup and no staleness re-validation — falling back
+        # to a one-call click on the cached row index
+        log.info(f"Clicking on shop with ID: {shop_id}")
+        onclick = onclicks[row_idx] if not clicked and row_idx < len(onclicks) else None
+        if onclick:
             try:
-                cells = row.find_elements(By.CSS_SELECTOR, 'td')
-                if cells:
-                    # Check if any cell contains the shop ID
-                    for cell in cells:
-                        if shop_id.lower() in cell.text.strip().lower():
-                            shop_row = row
-                            # Find the link in this row
-                            links = row.find_elements(By.TAG_NAME, 'a')
-                            if links:
-                                shop_link = links[0]
-                            break
-                if shop_link:
-                    break
+                # Mojarra handlers end in ';return false', which is illegal
+                # at Runtime.evaluate's top level, so run them inside an
+                # IIFE. CDP reports JS errors via exceptionDetails instead
+                # of raising — check it before trusting the click happened.
+                result = driver.execute_cdp_cmd("Runtime.evaluate", {
+                    "expression": "(function(){" + onclick + "})()",
+                    "awaitPromise": False
+                })
+                if result.get("exceptionDetails"):
+                    log.info(f"CDP click replay errored, using element click: "
+                             f"{result['exceptionDetails'].get('text', '')}")
+                else:
+                    clicked = True
             except Exception as e:
-                continue
-        
-        if not shop_link:
-            print(f"Could not find shop with ID: {shop_id}")
-            driver.save_screenshot(os.path.join(screenshots_dir, "shop_not_found.png"))
-            return False
-        
-        # Click on the shop link
-        print(f"Clicking on shop with ID: {shop_id}")
-        try:
-            driver.execute_script("arguments[0].click();", shop_link)
-        except Exception as e:
-            print(f"Error clicking shop link: {str(e)}")
+                log.info(f"CDP click replay failed, using element click: {str(e)}")
+        if not clicked:
+            clicked = driver.execute_script("""
+                var rows = arguments[0].querySelectorAll('tbody tr');
+                var r = rows[arguments[1]];
+                if (r) { var a = r.querySelector('a'); if (a) { a.click(); return true; } }
+                return false;
+            """, shop_table, row_idx)
+        if not clicked:
+            log.info(f"Error clicking shop link for {shop_id}")
             driver.save_screenshot(os.path.join(screenshots_dir, "shop_click_error.png"))
             return False
-        
-        # Wait for page to load
-        time.sleep(2)
-        wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
-        print("Page updated after shop click")
+
+        # Wait for the JSF update instead of a fixed sleep: the shop table
+        # goes stale when the postback swaps in the details view
+        try:
+            wait.until(EC.staleness_of(shop_table))
+        except TimeoutException:
+            pass
+        wait_for_ajax(driver, wait)
+        wait_for_page_load(driver)
+        log.info("Page updated after shop click")
         
         # Take screenshot
-        driver.save_screenshot(os.path.join(screenshots_dir, "after_shop_click.png"))
-        
+        debug_screenshot(driver, os.path.join(screenshots_dir, "after_shop_click.png"))
+
         # Extract shop details
-        print("Extracting shop details...")
+        log.info("Extracting shop details...")
         try:
-            # Save page source for analysis
-            with open(os.path.join(screenshots_dir, "shop_details_source.html"), "w", encoding="utf-8") as f:
-                f.write(driver.page_source)
-            
+            # Save page source for analysis (debug only — serializing and
+            # writing a full JSF page per shop costs real time at scale)
+            if _DEBUG:
+                debug_dump(os.path.join(screenshots_dir, "shop_details_source.html"),
+                           driver.page_source)
+
             # Extract all data from the page
             shop_details = {}
             
-            # Specifically look for shop status (online/offline)
+            # Specifically look for shop status (online/offline). One script
+            # call resolves it in-browser — the old path fetched every
+            # status-looking element's text individually and then shipped
+            # the entire page body text to Python just to substring it
             try:
-                status_elements = driver.find_elements(By.CSS_SELECTOR, '.shop-status, .status-indicator, .status, span[class*="status"], div[class*="status"]')
-                for element in status_elements:
-                    text = element.text.strip().lower()
-                    if 'online' in text or 'offline' in text or 'status' in text:
-                        shop_details['status'] = element.text.strip()
-                        print(f"Found shop status: {shop_details['status']}")
-                        break
-                
-                # If no specific status element found, try looking for text containing status
-                if 'status' not in shop_details:
-                    page_text = driver.find_element(By.TAG_NAME, 'body').text.lower()
-                    if 'online status' in page_text:
-                        # Find the index and extract nearby text
-                        idx = page_text.find('online status')
-                        context = page_text[max(0, idx-20):idx+30]
-                        shop_details['status_context'] = context
-                        print(f"Found status context: {context}")
-                        
-                    if 'offline' in page_text:
-                        shop_details['status'] = 'Offline'
-                        print("Shop appears to be offline")
-                    elif 'online' in page_text:
-                        shop_details['status'] = 'Online'
-                        print("Shop appears to be online")
+                probe = driver.execute_script("""
+                    var els = document.querySelectorAll(
+                        '.shop-status, .status-indicator, .status, span[class*="status"], div[class*="status"]');
+                    for (var i = 0; i < els.length; i++) {
+                        var text = els[i].innerText.trim();
+                        var low = text.toLowerCase();
+                        if (low.indexOf('online') !== -1 || low.indexOf('offline') !== -1 ||
+                            low.indexOf('status') !== -1) {
+                            return {status: text};
+                        }
+                    }
+                    var t = document.body.innerText.toLowerCase();
+                    var out = {};
+                    var idx = t.indexOf('online status');
+                    if (idx !== -1) {
+                        out.context = t.substring(Math.max(0, idx - 20), idx + 30);
+                    }
+                    if (t.indexOf('offline') !== -1) { out.status = 'Offline'; }
+                    else if (t.indexOf('online') !== -1) { out.status = 'Online'; }
+                    return out;
+                """) or {}
+                if probe.get('context'):
+                    shop_details['status_context'] = probe['context']
+                    log.info(f"Found status context: {probe['context']}")
+                if probe.get('status'):
+                    shop_details['status'] = probe['status']
+                    log.info(f"Found shop status: {shop_details['status']}")
             except Exception as e:
-                print(f"Error extracting shop status: {str(e)}")
-            
-            # Look for tables
-            tables = driver.find_elements(By.CSS_SELECTOR, 'table')
-            print(f"Found {len(tables)} tables on the shop details page")
-            
-            # Process each table
-            for i, table in enumerate(tables):
-                try:
-                    # Get table headers
-                    headers = [h.text.strip() for h in table.find_elements(By.CSS_SELECTOR, 'th')]
-                    
-                    # Get table rows
-                    rows = table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-                    
-                    # Process rows
-                    table_data = []
-                    for row in rows:
-                        cells = row.find_elements(By.CSS_SELECTOR, 'td')
-                        row_data = {}
-                        for j, cell in enumerate(cells):
-                            if j < len(headers):
-                                header = headers[j] if headers[j] else f"Column{j}"
-                                row_data[header] = cell.text.strip()
-                        if row_data:
-                            table_data.append(row_data)
-                    
-                    if table_data:
-                        shop_details[f"Table{i+1}"] = table_data
-                except Exception as e:
-                    print(f"Error processing table {i+1}: {str(e)}")
-            
-            # Look for labels and values
-            labels = driver.find_elements(By.CSS_SELECTOR, 'label, .label, .field-label')
-            for label in labels:
-                try:
-                    key = label.text.strip().replace(':', '')
-                    if not key:
-                        continue
-                        
-                    # Try to find the value next to this label
-                    value_element = driver.execute_script("return arguments[0].nextElementSibling;", label)
-                    value = value_element.text.strip() if value_element else ""
-                    
-                    if key and value:
-                        shop_details[key] = value
-                except Exception as e:
-                    pass
+                log.info(f"Error extracting shop status: {str(e)}")
+            
+            # Snapshot headers and rows of every table in one script call —
+            # the nested per-table loop paid a WebDriver round-trip per
+            # header and per cell, O(tables * rows * columns) on each of the
+            # thousands of shop pages visited
+            tables_data = driver.execute_script("""
+                return Array.from(document.querySelectorAll('table')).map(function(t) {
+                    return {
+                        headers: Array.from(t.querySelectorAll('th')).map(
+                            function(h) { return h.innerText.trim(); }),
+                        rows: Array.from(t.querySelectorAll('tbody tr')).map(function(r) {
+                            return Array.from(r.querySelectorAll('td')).map(
+                                function(c) { return c.innerText.trim(); });
+                        })
+                    };
+                });
+            """)
+            log.info(f"Found {len(tables_data)} tables on the shop details page")
+
+            # Build TableN entries in pure Python from the snapshot
+            for i, table in enumerate(tables_data):
+                names = [h if h else f"Column{j}" for j, h in enumerate(table["headers"])]
+                table_data = [row for row in
+                              (dict(zip(names, cells)) for cells in table["rows"])
+                              if row]
+                if table_data:
+                    shop_details[f"Table{i+1}"] = table_data
+            
+            # Look for labels and values — one script call harvests every
+            # label/next-sibling pair, instead of a find_elements pass plus
+            # two round-trips (sibling lookup + .text) per label
+            try:
+                pairs = driver.execute_script("""
+                    var out = {};
+                    document.querySelectorAll('label, .label, .field-label').forEach(function(l) {
+                        var key = l.innerText.trim().replace(/:/g, '');
+                        var v = l.nextElementSibling;
+                        if (key && v) {
+                            var value = v.innerText.trim();
+                            if (value) { out[key] = value; }
+                        }
+                    });
+                    return out;
+                """)
+                shop_details.update(pairs)
+            except Exception as e:
+                log.info(f"Error extracting label/value pairs: {str(e)}")
             
-            print("Successfully extracted shop details")
+            log.info("Successfully extracted shop details")
             if shop_details:
-                print(f"Found {len(shop_details)} data points")
+                log.info(f"Found {len(shop_details)} data points")
                 
             # Save shop details to the proper directory
             shop_data = {
@@ -2161,12 +3333,15 @@ def navigate_to_shop_and_get_details(driver, wait, shop_id, district, taluk, out
                 "details": shop_details
             }
             
-            # Save to the taluk directory
+            # Save to the taluk directory — orjson serializes in C, and
+            # 2-space indent halves the bytes of the old indent=4 output
+            # while staying diffable. The disk write itself goes to the
+            # background writer so it overlaps with the next navigation.
+            import orjson
             shop_file = os.path.join(output_dir, f"pds_shop_details_{shop_id}.json")
-            with open(shop_file, 'w') as f:
-                json.dump(shop_data, f, indent=4)
+            enqueue_write(shop_file, orjson.dumps(shop_data, option=orjson.OPT_INDENT_2))
             
-            print(f"Saved shop details to {shop_file}")
+            log.info(f"Saved shop details to {shop_file}")
             
             # Extract last bill transaction and try to click on View link
             last_bill = {}
@@ -2182,108 +3357,91 @@ def navigate_to_shop_and_get_details(driver, wait, shop_id, district, taluk, out
                     }
                     
                     # Try to find and click the View button on the shop details page
-                    print("Looking for View button on shop details page...")
-                    # First scroll down to make sure the transaction table is visible
-                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1)
-                    
-                    # Take a screenshot after scrolling
-                    os.makedirs("screenshots", exist_ok=True)
-                    driver.save_screenshot(os.path.join("screenshots", f"{shop_id}_after_scroll.png"))
-                    print(f"Saved screenshot after scrolling: screenshots/{shop_id}_after_scroll.png")
+                    log.info("Looking for View button on shop details page...")
+                    # Bring the View link itself into view — scrolling the
+                    # whole page and sleeping a second was pure overhead,
+                    # and scrollIntoView is synchronous
+                    driver.execute_script("""
+                        var v = document.querySelector("a.link-view, a[onclick*='billItemWidget']");
+                        if (v) { v.scrollIntoView({block: 'center'}); return true; }
+                        return false;
+                    """)
                     
-                    # Try different XPaths to find the View link
-                    view_links = driver.find_elements(By.XPATH, "//a[contains(@class, 'link-view') and text()='View']")
-                    if not view_links or len(view_links) == 0:
-                        view_links = driver.find_elements(By.XPATH, "//a[contains(@onclick, 'billItemWidget') and text()='View']")
-                    if not view_links or len(view_links) == 0:
-                        view_links = driver.find_elements(By.XPATH, "//a[text()='View']")
+                    # Take a screenshot after scrolling (debug only)
+                    if _DEBUG:
+                        os.makedirs("screenshots", exist_ok=True)
+                        debug_screenshot(driver, os.path.join("screenshots", f"{shop_id}_after_scroll.png"))
                     
-                    if view_links and len(view_links) > 0:
-                        print(f"Found {len(view_links)} View links. Clicking the first one...")
-                        # Try to click using JavaScript
+                    # Debug only: screenshot and page source before clicking
+                    if _DEBUG:
+                        os.makedirs("screenshots", exist_ok=True)
+                        debug_screenshot(driver, os.path.join("screenshots", f"{shop_id}_before_click.png"))
+                        debug_dump(os.path.join("screenshots", f"{shop_id}_page_source.html"),
+                                   driver.page_source)
+
+                    # Find and click the View link in one script call — the
+                    # old cascade of contains() XPaths cost up to three
+                    # find_elements round-trips (contains() evaluation is
+                    # slow in WebDriver) plus a scroll and a fixed sleep
+                    view_clicked = driver.execute_script("""
+                        var a = document.querySelector("a.link-view, a[onclick*='billItemWidget']");
+                        if (!a || a.textContent.trim() !== 'View') {
+                            a = null;
+                            var links = document.querySelectorAll('a');
+                            for (var i = 0; i < links.length; i++) {
+                                if (links[i].textContent.trim() === 'View') { a = links[i]; break; }
+                            }
+                        }
+                        if (a) { a.click(); return true; }
+                        return false;
+                    """)
+                    if view_clicked:
                         try:
-                            driver.execute_script("arguments[0].scrollIntoView(true);", view_links[0])
-                            time.sleep(1)  # Wait for scroll to complete
-                            
-                            # First, save a screenshot of the page before clicking
-                            os.makedirs("screenshots", exist_ok=True)
-                            driver.save_screenshot(os.path.join("screenshots", f"{shop_id}_before_click.png"))
-                            print(f"Saved screenshot before clicking View link: screenshots/{shop_id}_before_click.png")
-                            
-                            # Get the page source to check for View links
-                            page_source = driver.page_source
-                            with open(os.path.join("screenshots", f"{shop_id}_page_source.html"), "w", encoding="utf-8") as f:
-                                f.write(page_source)
-                            print(f"Saved page source to screenshots/{shop_id}_page_source.html")
-                            
-                            # Try to click the View link
-                            view_links[0].click()
-                            print("Clicked on View link")
-                            
-                            # Wait for the bill details dialog to appear
-                            WebDriverWait(driver, 15).until(
-                                EC.presence_of_element_located((By.XPATH, "//div[contains(@class, 'ui-dialog')]//span[contains(@class, 'ui-dialog-title') and contains(text(), 'Transactions')]"))
+                            log.info("Clicked on View link")
+
+                            # Wait for the bill details dialog to appear —
+                            # CSS pre-scope plus a text check in Python is
+                            # cheaper than the old contains() XPath per poll
+                            get_wait(driver, 15).until(
+                                lambda d: any("Transactions" in t.text
+                                              for t in d.find_elements(By.CSS_SELECTOR, "div.ui-dialog span.ui-dialog-title"))
                             )
-                            print("Bill details dialog opened")
+                            log.info("Bill details dialog opened")
                             
                             # Take a screenshot of the dialog for debugging
-                            driver.save_screenshot(os.path.join("screenshots", f"{shop_id}_bill_dialog.png"))
-                            print(f"Saved bill dialog screenshot to screenshots/{shop_id}_bill_dialog.png")
-                            
-                            # Extract bill details from the dialog
-                            bill_details_table = driver.find_elements(By.XPATH, "//div[contains(@class, 'ui-dialog')]//form[@id='billForm']//table")
-                            if not bill_details_table or len(bill_details_table) == 0:
-                                bill_details_table = driver.find_elements(By.XPATH, "//div[contains(@class, 'ui-dialog')]//table")
+                            if _DEBUG:
+                                os.makedirs("screenshots", exist_ok=True)
+                                debug_screenshot(driver, os.path.join("screenshots", f"{shop_id}_bill_dialog.png"))
                             
-                            if bill_details_table and len(bill_details_table) > 0:
-                                print(f"Found bill details table with {len(bill_details_table)} tables")
-                                # Extract all rows from the bill details table
-                                bill_items = []
-                                rows = bill_details_table[0].find_elements(By.TAG_NAME, "tr")
-                                print(f"Found {len(rows)} rows in bill details table")
-                                
-                                # Get the header row to identify columns
-                                header_cells = rows[0].find_elements(By.TAG_NAME, "th") if rows else []
-                                headers = [cell.text.strip() for cell in header_cells]
-                                print(f"Found headers: {headers}")
-                                
-                                # Process data rows
-                                for row in rows[1:]:  # Skip header row
-                                    cells = row.find_elements(By.TAG_NAME, "td")
-                                    print(f"Row has {len(cells)} cells")
-                                    if len(cells) >= 6:  # Based on the provided HTML
-                                        item = {
-                                            "sno": cells[0].text.strip(),
-                                            "product_name": cells[1].text.strip(),
-                                            "quantity": cells[2].text.strip(),
-                                            "unit_price": cells[3].text.strip(),
-                                            "total": cells[4].text.strip(),
-                                            "unit": cells[5].text.strip()
-                                        }
-                                        bill_items.append(item)
-                                        print(f"Added item: {item}")
-                                
+                            # Grab the dialog markup in one call and parse it
+                            # locally with lxml — pure read-only extraction
+                            # doesn't need any further WebDriver traffic
+                            from lxml import html as lxml_html
+                            dialog_html = driver.find_element(By.CSS_SELECTOR, "div.ui-dialog").get_attribute("outerHTML")
+                            tree = lxml_html.fromstring(dialog_html)
+                            row_nodes = (tree.xpath(".//form[@id='billForm']//table//tr")
+                                         or tree.xpath(".//table//tr"))
+                            dialog_rows = [["".join(cell.itertext()).strip()
+                                            for cell in row.xpath("./th|./td")]
+                                           for row in row_nodes]
+
+                            if dialog_rows:
+                                # Skip the header row; zip against the fixed
+                                # column order instead of indexing each cell
+                                bill_items = [dict(zip(BILL_ITEM_KEYS, cells))
+                                              for cells in dialog_rows[1:]
+                                              if len(cells) >= len(BILL_ITEM_KEYS)]
                                 bill_details["items"] = bill_items
-                                print(f"Extracted {len(bill_items)} bill items")
+                                log.info(f"Extracted {len(bill_items)} bill items")
                             else:
                                 print("Could not find bill details table in dialog")
                             
-                            # Close the dialog
-                            close_buttons = driver.find_elements(By.XPATH, "//div[contains(@class, 'ui-dialog-titlebar')]//a[contains(@class, 'ui-dialog-titlebar-close')]")
-                            if not close_buttons or len(close_buttons) == 0:
-                                close_buttons = driver.find_elements(By.XPATH, "//div[contains(@class, 'ui-dialog')]//a[contains(@class, 'ui-dialog-titlebar-close')]")
-                            
-                            if close_buttons and len(close_buttons) > 0:
-                                close_buttons[0].click()
-                                print("Closed bill details dialog")
-                                time.sleep(1)  # Wait for dialog to close
-                            else:
-                                print("Could not find close button for dialog")
-                                # Try pressing Escape key to close dialog
-                                webdriver.ActionChains(driver).send_keys(Keys.ESCAPE).perform()
-                                print("Sent Escape key to close dialog")
-                                time.sleep(1)
+                            # No need to close the dialog: every caller
+                            # immediately navigates away (breadcrumb postback
+                            # or state reset), which replaces the DOM along
+                            # with the dialog, and those clicks are scripted
+                            # so the modal overlay can't block them
+                            log.info("Leaving bill details dialog open for the next navigation")
                         except Exception as e:
                             print(f"Error clicking View link or extracting bill details: {str(e)}")
                     else:
@@ -2327,9 +3485,153 @@ def navigate_to_shop_and_get_details(driver, wait, shop_id, district, taluk, out
         driver.save_screenshot(os.path.join(screenshots_dir, "shop_navigation_error.png"))
         return False
 
-def save_data_to_json(data, filename):
-    with open(filename, 'w') as f:
-        json.dump(data, f)
+def crawl_taluk_shops_parallel(shops, district, taluk, taluk_dir, max_workers=4,
+                               headless=True, driver_pool=None):
+    """
+    Crawl a taluk's shops concurrently over a pool of pre-warmed Chrome
+    sessions. Shop visits are independent and I/O-bound (remote page
+    loads and JSF postbacks), so K workers cut the taluk's wall-clock
+    time to roughly 1/K until the server starts throttling. Callers
+    crawling many taluks should pass their own DriverPool so the
+    browsers stay warm across taluks instead of being rebooted per call.
+
+    Returns [(shop, result)] in completion order, where result is what
+    navigate_to_shop_and_get_details returned for that shop.
+    """
+    from concurrent.futures import as_completed
+
+    workers = max(1, min(max_workers, len(shops)))
+    own_pool = driver_pool is None
+    pool = driver_pool if driver_pool is not None else DriverPool(workers, headless=headless, prewarm=True)
+
+    def crawl_one(shop):
+        worker = pool.acquire()
+        try:
+            worker_wait = WebDriverWait(worker, 20, poll_frequency=0.1)
+            # A worker comes back on whatever page its last job left it,
+            # so each job restarts from the state-level report
+            if not reset_to_state_level(worker, worker_wait):
+                return False
+            if not navigate_to_district_and_get_taluks(worker, worker_wait, district):
+                return False
+            if not navigate_to_taluk_and_get_shops(worker, worker_wait, taluk):
+                return False
+            return navigate_to_shop_and_get_details(
+                worker, worker_wait, shop['SHOP CODE'], district, taluk, taluk_dir,
+                shop_name_from_search=shop.get('SHOP NAME'))
+        finally:
+            pool.release(worker)
+
+    results = []
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(crawl_one, shop): shop for shop in shops}
+            for future in as_completed(futures):
+                shop = futures[future]
+                try:
+                    results.append((shop, future.result()))
+                except Exception as e:
+                    print(f"Error crawling shop {shop.get('SHOP CODE')}: {str(e)}")
+                    results.append((shop, False))
+    finally:
+        # A caller-supplied pool stays warm for the next taluk
+        if own_pool:
+            pool.quit_all()
+    return results
+
+def build_crawl_summary(events_file, summary_file):
+    """
+    Fold the crawl's NDJSON event log into the nested summary file.
+
+    During the run each district/taluk/shop appends one event line (O(1)
+    per shop); this reconstructs the aggregate in a single pass at the
+    end instead of rewriting the whole growing dict as the crawl goes.
+    """
+    import orjson
+    summary = {
+        "total_districts": 0,
+        "total_taluks": 0,
+        "total_shops": 0,
+        "online_shops": 0,
+        "offline_shops": 0,
+        "districts": {}
+    }
+
+    def district_entry(name):
+        entry = summary["districts"].get(name)
+        if entry is None:
+            entry = {
+                "total_taluks": 0,
+                "total_shops": 0,
+                "online_shops": 0,
+                "offline_shops": 0,
+                "taluks": {}
+            }
+            summary["districts"][name] = entry
+            summary["total_districts"] += 1
+        return entry
+
+    def taluk_entry(name, taluk):
+        district = district_entry(name)
+        entry = district["taluks"].get(taluk)
+        if entry is None:
+            entry = {
+                "total_shops": 0,
+                "processed_shops": 0,
+                "online_shops": 0,
+                "offline_shops": 0,
+                "shops": {}
+            }
+            district["taluks"][taluk] = entry
+            district["total_taluks"] += 1
+            summary["total_taluks"] += 1
+        return entry
+
+    try:
+        with open(events_file, 'rb') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                event = orjson.loads(line)
+                district = event.get("district")
+                if event.get("type") == "district":
+                    district_entry(district)
+                elif event.get("type") == "taluk":
+                    taluk_entry(district, event.get("taluk"))
+                elif event.get("type") == "shop":
+                    taluk = taluk_entry(district, event.get("taluk"))
+                    shop_id = event.get("shop")
+                    status = event.get("status", "Unknown")
+                    # The events file is append-only across runs and resumed
+                    # shops are re-emitted, so the same shop can appear more
+                    # than once; only the first occurrence counts
+                    if shop_id in taluk["shops"]:
+                        continue
+                    taluk["shops"][shop_id] = {
+                        "name": event.get("name", ""),
+                        "status": status,
+                        "incharge": event.get("incharge", ""),
+                        "cards": event.get("cards", ""),
+                        "beneficiaries": event.get("beneficiaries", "")
+                    }
+                    taluk["total_shops"] += 1
+                    summary["districts"][district]["total_shops"] += 1
+                    summary["total_shops"] += 1
+                    if status.lower() == 'online':
+                        taluk["online_shops"] += 1
+                        summary["districts"][district]["online_shops"] += 1
+                        summary["online_shops"] += 1
+                    elif status.lower() == 'offline':
+                        taluk["offline_shops"] += 1
+                        summary["districts"][district]["offline_shops"] += 1
+                        summary["offline_shops"] += 1
+    except FileNotFoundError:
+        pass
+
+    with open(summary_file, 'wb') as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+    return summary
 
 def main():
     """Main function to run the crawler"""
@@ -2347,9 +3649,18 @@ def main():
     parser.add_argument('--limit-districts', type=int, default=0, help='Limit number of districts to crawl (0 = all)')
     parser.add_argument('--limit-taluks', type=int, default=0, help='Limit number of taluks per district to crawl (0 = all)')
     parser.add_argument('--limit-shops', type=int, default=0, help='Limit number of shops per taluk to crawl (0 = all)')
+    parser.add_argument('--parallel-shops', type=int, default=1, help='Number of parallel Chrome sessions for shop crawling (1 = sequential)')
     parser.add_argument('--shop-list-json', type=str, help='JSON file containing a list of shop IDs to check')
     parser.add_argument('--output-json', type=str, help='JSON file to save results when using --shop-list-json')
+    parser.add_argument('--debug', action='store_true', help='Save debug screenshots and page-source dumps (also via PDS_CRAWL_DEBUG)')
     args = parser.parse_args()
+
+    # The debug helpers check the module-level flag; the CLI switch is just
+    # a friendlier way to set it than the environment variable
+    if args.debug:
+        global _DEBUG
+        _DEBUG = True
+        log.setLevel(logging.INFO)
     
     # Check if we're in shop list JSON mode
     if args.shop_list_json:
@@ -2366,16 +3677,23 @@ def main():
     os.makedirs(args.output_dir, exist_ok=True)
     os.makedirs(args.screenshots_dir, exist_ok=True)
     
-    # Initialize WebDriver
+    # Initialize WebDriver through the shared factory so the regular crawl
+    # gets the same tuned profile as the shop-list mode: images disabled
+    # via prefs and blink flag, fonts/CSS/analytics blocked over CDP,
+    # eager page-load strategy, and the in-flight AJAX tracker
     print("Initializing WebDriver...")
-    options = Options()
-    if args.headless:
-        options.add_argument("--headless")
-    options.add_argument("--window-size=1920,1080")
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    wait = WebDriverWait(driver, 30)
-    
+    load_selenium()
+    driver = create_chrome_driver(headless=args.headless)
+    # 100 ms polls notice JSF updates ~5x sooner than the 500 ms default
+    wait = WebDriverWait(driver, 30, poll_frequency=0.1)
+
+    # Worker-driver pool for --parallel-shops, created on first use and
+    # kept warm for the whole run
+    shop_pool = None
+    resume_fh = None
+    events_fh = None
+    summary = None
+
     try:
         # Navigate to main page
         success = navigate_to_main_page(driver, wait)
@@ -2389,17 +3707,23 @@ def main():
             print("Failed to get districts")
             return
         
-        # Create a summary file to track progress
+        # Progress goes to an append-only NDJSON event log — one line per
+        # district/taluk/shop, O(1) each — and the nested crawl_summary.json
+        # is rebuilt from it in a single pass at the end, instead of
+        # re-serializing the whole growing dict throughout the run
+        import orjson
         summary_file = os.path.join(args.output_dir, "crawl_summary.json")
-        summary = {
-            "total_districts": 0,
-            "total_taluks": 0,
-            "total_shops": 0,
-            "online_shops": 0,
-            "offline_shops": 0,
-            "districts": {}
-        }
-        
+        events_file = os.path.join(args.output_dir, "summary.ndjson")
+        events_fh = open(events_file, 'ab', buffering=1 << 20)
+
+        def emit_event(event):
+            events_fh.write(orjson.dumps(event) + b"\n")
+
+        # Append-only progress log so an interrupted run can be inspected;
+        # resuming itself keys off the per-shop files already on disk
+        resume_fh = open(os.path.join(args.output_dir, "resume.log"), 'a',
+                         encoding='utf-8', buffering=1 << 16)
+
         # Filter districts if specified
         if args.district:
             if args.district in all_districts:
@@ -2427,15 +3751,8 @@ def main():
                 print(f"Failed to get taluks for district {district}, skipping")
                 continue
             
-            # Add district to summary
-            summary["districts"][district] = {
-                "total_taluks": 0,
-                "total_shops": 0,
-                "online_shops": 0,
-                "offline_shops": 0,
-                "taluks": {}
-            }
-            summary["total_districts"] += 1
+            # Record the district in the event log
+            emit_event({"type": "district", "district": district})
             
             # Filter taluks if specified
             if args.taluk:
@@ -2473,85 +3790,100 @@ def main():
                         print(f"Failed to get shops for taluk {taluk} after reset, skipping")
                         continue
                 
-                # Add taluk to summary
-                summary["districts"][district]["taluks"][taluk] = {
-                    "total_shops": len(shops),
-                    "processed_shops": 0,
-                    "online_shops": 0,
-                    "offline_shops": 0,
-                    "shops": {}
-                }
-                summary["districts"][district]["total_taluks"] += 1
-                summary["total_taluks"] += 1
+                # Record the taluk in the event log
+                emit_event({"type": "taluk", "district": district, "taluk": taluk})
                 
-                # Filter shops if specified
+                # Filter shops if specified — the code index gives an O(1)
+                # lookup (the old loop also scanned an undefined all_shops)
+                shops_by_code = {s['SHOP CODE']: s for s in shops}
                 if args.shop:
-                    shop_found = False
-                    shops_to_crawl = []
-                    for shop in all_shops:
-                        if shop['SHOP CODE'] == args.shop:
-                            shops_to_crawl = [shop]
-                            shop_found = True
-                            break
-                    if not shop_found:
+                    if args.shop not in shops_by_code:
                         print(f"Shop {args.shop} not found in taluk {taluk}, skipping")
                         continue
+                    shops_to_crawl = [shops_by_code[args.shop]]
                 else:
                     shops_to_crawl = shops
                     if args.limit_shops > 0:
                         shops_to_crawl = shops_to_crawl[:args.limit_shops]
                     print(f"    Crawling {len(shops_to_crawl)} shops in taluk {taluk}")
                 
-                # Process each shop
-                for shop_idx, shop in enumerate(shops_to_crawl):
+                # Resume support: shops whose detail file already exists were
+                # completed by an earlier (possibly crashed) run — count them
+                # from disk instead of re-crawling
+                done_shops = [s for s in shops_to_crawl
+                              if os.path.exists(os.path.join(
+                                  taluk_dir, f"pds_shop_details_{s['SHOP CODE']}.json"))]
+                if done_shops:
+                    print(f"    Skipping {len(done_shops)} already-crawled shops in taluk {taluk}")
+                    shops_to_crawl = [s for s in shops_to_crawl if s not in done_shops]
+
+                # Process shops — in parallel worker sessions when requested,
+                # otherwise sequentially on the main driver
+                if not shops_to_crawl:
+                    shop_results = []
+                elif args.parallel_shops > 1 and len(shops_to_crawl) > 1:
+                    # One pool for the whole run — booting Chrome costs
+                    # seconds, so the workers stay warm across taluks
+                    if shop_pool is None:
+                        shop_pool = DriverPool(args.parallel_shops,
+                                               headless=args.headless, prewarm=True)
+                    shop_results = crawl_taluk_shops_parallel(
+                        shops_to_crawl, district, taluk, taluk_dir,
+                        max_workers=args.parallel_shops, headless=args.headless,
+                        driver_pool=shop_pool)
+                else:
+                    shop_results = []
+                    for shop_idx, shop in enumerate(shops_to_crawl):
+                        shop_id = shop['SHOP CODE']
+                        print(f"    [{shop_idx+1}/{len(shops_to_crawl)}] Processing shop: {shop_id} - {shop['SHOP NAME']}")
+
+                        # First shop starts from the taluk page we're already
+                        # on; later shops hop back via one breadcrumb click
+                        # instead of re-walking district and taluk
+                        if shop_idx == 0:
+                            result = navigate_to_shop_and_get_details(
+                                driver, wait, shop_id, district, taluk, taluk_dir)
+                        else:
+                            result = visit_shop_via_taluk(
+                                driver, wait, shop_id, district, taluk, taluk_dir)
+                        shop_results.append((shop, result))
+
+                # The fold below reads the per-shop files back, so make sure
+                # the background writer has landed them first
+                flush_pending_writes()
+
+                # Append one event per shop to the log; resumed shops fold
+                # in from their existing files
+                for shop, success in [(s, True) for s in done_shops] + shop_results:
                     shop_id = shop['SHOP CODE']
-                    print(f"    [{shop_idx+1}/{len(shops_to_crawl)}] Processing shop: {shop_id} - {shop['SHOP NAME']}")
-                    
-                    # Navigate to shop and get details
-                    success = navigate_to_shop_and_get_details(driver, wait, shop_id, district, taluk, taluk_dir)
-                    
                     if success:
                         # Read the shop details file to get status
                         shop_file = os.path.join(taluk_dir, f"pds_shop_details_{shop_id}.json")
                         try:
-                            with open(shop_file, 'r') as f:
-                                shop_data = json.load(f)
-                                shop_status = shop_data.get('details', {}).get('shop_status', 'Unknown')
-                                
-                                # Add shop to summary
-                                summary["districts"][district]["taluks"][taluk]["shops"][shop_id] = {
-                                    "name": shop['SHOP NAME'],
-                                    "status": shop_status,
-                                    "incharge": shop['SHOP INCHARGE'],
-                                    "cards": shop['TOTAL NUMBER OF CARDS'],
-                                    "beneficiaries": shop['TOTAL NUMBER OF BENEFICIARIES']
-                                }
-                                
-                                summary["districts"][district]["taluks"][taluk]["total_shops"] += 1
-                                summary["districts"][district]["total_shops"] += 1
-                                summary["total_shops"] += 1
-                                
-                                if shop_status.lower() == 'online':
-                                    summary["districts"][district]["taluks"][taluk]["online_shops"] += 1
-                                    summary["districts"][district]["online_shops"] += 1
-                                    summary["online_shops"] += 1
-                                elif shop_status.lower() == 'offline':
-                                    summary["districts"][district]["taluks"][taluk]["offline_shops"] += 1
-                                    summary["districts"][district]["offline_shops"] += 1
-                                    summary["offline_shops"] += 1
+                            with open(shop_file, 'rb') as f:
+                                shop_data = orjson.loads(f.read())
+                            shop_status = shop_data.get('details', {}).get('shop_status', 'Unknown')
+                            emit_event({
+                                "type": "shop",
+                                "district": district,
+                                "taluk": taluk,
+                                "shop": shop_id,
+                                "name": shop['SHOP NAME'],
+                                "status": shop_status,
+                                "incharge": shop['SHOP INCHARGE'],
+                                "cards": shop['TOTAL NUMBER OF CARDS'],
+                                "beneficiaries": shop['TOTAL NUMBER OF BENEFICIARIES']
+                            })
                         except Exception as e:
                             print(f"Error processing shop details for {shop_id}: {str(e)}")
+                        resume_fh.write(f"{district}\t{taluk}\t{shop_id}\n")
                     else:
                         print(f"Failed to get details for shop {shop_id}, skipping")
-                    
-                    # Save summary after each shop to track progress
-                    with open(summary_file, 'w') as f:
-                        json.dump(summary, f, indent=2)
-                    
-                    # Navigate back to taluk page to continue with next shop
-                    navigate_to_district_and_get_taluks(driver, wait, district)
-                    navigate_to_taluk_and_get_shops(driver, wait, taluk)
-                
+
+                # End of taluk: land the events so a crash loses at most
+                # one taluk's worth of lines
+                events_fh.flush()
+
                 # After processing all shops for a taluk, try to go back to district page using breadcrumbs
                 if not navigate_back_using_breadcrumbs(driver, wait, 'district'):
                     print("Failed to navigate back to district using breadcrumbs, using regular navigation")
@@ -2574,6 +3906,10 @@ def main():
                 print("Navigation state verification failed for state level, resetting navigation")
                 navigate_to_pds_reports_and_get_districts(driver, wait)
         
+        # Aggregate the event log into the nested summary in one pass
+        events_fh.flush()
+        summary = build_crawl_summary(events_file, summary_file)
+
         print("\nCrawling completed successfully!")
         print(f"Data saved to {args.output_dir}/")
         print(f"Summary saved to {summary_file}")
@@ -2592,6 +3928,22 @@ def main():
         import traceback
         traceback.print_exc()
     finally:
+        if events_fh is not None:
+            try:
+                events_fh.close()
+                # Crashed runs still get a summary covering the events
+                # that made it to disk
+                if summary is None:
+                    build_crawl_summary(events_file, summary_file)
+            except Exception as e:
+                print(f"Error finalizing crawl summary: {str(e)}")
+        if resume_fh is not None:
+            try:
+                resume_fh.close()
+            except Exception:
+                pass
+        if shop_pool is not None:
+            shop_pool.quit_all()
         # Take final screenshot
         driver.save_screenshot("final_state.png")
         print("Final screenshot saved")